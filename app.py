@@ -2069,6 +2069,17 @@ def _summary_window_for_user(user: User, now_utc: datetime) -> tuple[datetime, d
     return start, end, _format_offset_label(offset_minutes), now_local
 
 
+_EVENT_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _format_event_dt(dt: datetime) -> str:
+    # Same text as dt.strftime("%b %d, %Y %I:%M %p") without parsing the format per event.
+    return (
+        f"{_EVENT_MONTH_ABBRS[dt.month - 1]} {dt.day:02d}, {dt.year} "
+        f"{dt.hour % 12 or 12:02d}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+    )
+
+
 def _format_event_line(event: ScheduleEvent, customer: Customer | None) -> str:
     title = (event.title or "").strip() or (customer.name if customer else "Appointment")
     if customer and customer.name and title.lower() != customer.name.lower():
@@ -2076,9 +2087,7 @@ def _format_event_line(event: ScheduleEvent, customer: Customer | None) -> str:
     else:
         label = title
 
-    start_label = event.start_dt.strftime("%b %d, %Y %I:%M %p").lstrip("0")
-    end_label = event.end_dt.strftime("%b %d, %Y %I:%M %p").lstrip("0")
-    return f"- {start_label} → {end_label}: {label}"
+    return f"- {_format_event_dt(event.start_dt)} → {_format_event_dt(event.end_dt)}: {label}"
 
 
 def _should_send_summary(user: User, now_utc: datetime) -> bool:
@@ -4710,6 +4719,14 @@ def _migrate_invoice_useful_info(engine):
             conn.execute(text("ALTER TABLE invoices ADD COLUMN useful_info TEXT"))
 
 
+def _migrate_invoice_pdf_content_hash(engine):
+    if not _table_exists(engine, "invoices"):
+        return
+    if not _column_exists(engine, "invoices", "pdf_content_hash"):
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE invoices ADD COLUMN pdf_content_hash VARCHAR(32)"))
+
+
 def _migrate_invoice_converted_flag(engine):
     if not _table_exists(engine, "invoices"):
         return
@@ -5729,6 +5746,7 @@ def create_app():
     _migrate_invoice_contact_fields(engine)
     _migrate_invoice_payment_reminder_fields(engine)
     _migrate_invoice_useful_info(engine)
+    _migrate_invoice_pdf_content_hash(engine)
     _migrate_invoice_converted_flag(engine)
     _migrate_estimate_converted_flag(engine)
     _migrate_user_invoice_template(engine)
@@ -8269,15 +8287,16 @@ def create_app():
                     inv.paid = 120.0
                     inv.hours = 120.0 - inv.parts_total_raw() - inv.shop_supplies
 
+                pdf_buf = io.BytesIO()
                 pdf_path = generate_and_store_pdf(
                     s,
                     inv.id,
                     custom_cfg_override=custom_cfg_override,
                     pdf_template_override=pdf_tmpl,
                     builder_cfg_override=builder_cfg_override,
+                    out_stream=pdf_buf,
                 )
-                with open(pdf_path, "rb") as f:
-                    pdf_bytes = f.read()
+                pdf_bytes = pdf_buf.getvalue()
             finally:
                 if inv is not None:
                     try:
@@ -9624,6 +9643,7 @@ def create_app():
                     ]
                 )
 
+                pdf_buf = io.BytesIO()
                 pdf_path = generate_and_store_pdf(
                     s,
                     inv.id,
@@ -9634,9 +9654,9 @@ def create_app():
                         "compact_mode": bool(getattr(u, "invoice_builder_compact_mode", False)),
                     },
                     invoice_builder_design_override=design_obj,
+                    out_stream=pdf_buf,
                 )
-                with open(pdf_path, "rb") as f:
-                    pdf_bytes = f.read()
+                pdf_bytes = pdf_buf.getvalue()
             finally:
                 if inv is not None:
                     try:
@@ -1,6 +1,7 @@
 # bulk_generate_pdfs.py
 import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 from config import Config
@@ -8,11 +9,59 @@ from models import Base, make_engine, make_session_factory, Invoice
 from pdf_service import generate_and_store_pdf
 
 
+_worker_session_factory = None
+
+
+def _init_worker():
+    # Each worker process gets its own engine; pooled connections must not be shared across a fork.
+    global _worker_session_factory
+    engine = make_engine(Config.SQLALCHEMY_DATABASE_URI, echo=Config.SQLALCHEMY_ECHO)
+    _worker_session_factory = make_session_factory(engine)
+
+
+def _generate_chunk(invoice_ids: list[int], cfg_override: dict | None = None, force: bool = False):
+    # Render a run of invoices in one session and commit their pdf_path updates together.
+    results = []
+    with _worker_session_factory() as s:
+        for invoice_id in invoice_ids:
+            try:
+                path = generate_and_store_pdf(
+                    s, invoice_id, custom_cfg_override=cfg_override, commit=False, force=force
+                )
+                results.append((invoice_id, path, None))
+            except Exception as e:
+                results.append((invoice_id, None, str(e)))
+        try:
+            s.commit()
+        except Exception as e:
+            s.rollback()
+            return [(invoice_id, None, error or f"commit failed: {e}") for invoice_id, _, error in results]
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(description="Bulk generate invoice PDFs.")
     parser.add_argument("--year", type=str, default="", help="Only generate PDFs for a given year (YYYY).")
     parser.add_argument("--all", action="store_true", help="Regenerate PDFs even if one already exists.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=f"Number of worker processes to render with (default: 1, this machine has {os.cpu_count() or 1} CPUs).",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Favor throughput over styling (e.g. square summary boxes instead of rounded ones).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=25,
+        help="Invoices handed to a worker at a time, committed together (default: 25).",
+    )
     args = parser.parse_args()
+    cfg_override = {"fast_mode": True} if args.fast else None
 
     # Ensure exports dir exists
     Path(Config.EXPORTS_DIR).mkdir(parents=True, exist_ok=True)
@@ -42,21 +91,45 @@ def main():
         skipped = 0
         failed = 0
 
+        pending = []
         for i, inv in enumerate(invoices, start=1):
-            try:
-                has_pdf = bool(inv.pdf_path) and os.path.exists(inv.pdf_path or "")
-                if has_pdf and not args.all:
-                    skipped += 1
-                    print(f"[{i}/{total}] SKIP  {inv.invoice_number} (already has PDF)")
-                    continue
-
-                path = generate_and_store_pdf(s, inv.id)
-                generated += 1
-                print(f"[{i}/{total}] DONE  {inv.invoice_number} -> {path}")
-
-            except Exception as e:
-                failed += 1
-                print(f"[{i}/{total}] FAIL  {inv.invoice_number}  ({e})")
+            has_pdf = bool(inv.pdf_path) and os.path.exists(inv.pdf_path or "")
+            if has_pdf and not args.all:
+                skipped += 1
+                print(f"[{i}/{total}] SKIP  {inv.invoice_number} (already has PDF)")
+                continue
+            pending.append((i, inv.id, inv.invoice_number))
+
+        if args.workers <= 1:
+            for i, invoice_id, invoice_number in pending:
+                try:
+                    path = generate_and_store_pdf(s, invoice_id, custom_cfg_override=cfg_override, force=args.all)
+                    generated += 1
+                    print(f"[{i}/{total}] DONE  {invoice_number} -> {path}")
+
+                except Exception as e:
+                    failed += 1
+                    print(f"[{i}/{total}] FAIL  {invoice_number}  ({e})")
+        else:
+            # Rendering is CPU-bound and holds the GIL, so fan out across processes.
+            # Workers only receive invoice ids and load everything through their own session.
+            labels = {invoice_id: (i, invoice_number) for i, invoice_id, invoice_number in pending}
+            ids = [invoice_id for _, invoice_id, _ in pending]
+            size = max(1, args.chunk_size)
+            with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+                futures = [
+                    pool.submit(_generate_chunk, ids[start:start + size], cfg_override, args.all)
+                    for start in range(0, len(ids), size)
+                ]
+                for fut in as_completed(futures):
+                    for invoice_id, path, error in fut.result():
+                        i, invoice_number = labels[invoice_id]
+                        if error is None:
+                            generated += 1
+                            print(f"[{i}/{total}] DONE  {invoice_number} -> {path}")
+                        else:
+                            failed += 1
+                            print(f"[{i}/{total}] FAIL  {invoice_number}  ({error})")
 
         print("\n✅ Bulk PDF generation complete.")
         print(f"Generated: {generated}")
@@ -67,4 +140,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
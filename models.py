@@ -571,6 +571,7 @@ class Invoice(Base):
 
     pdf_path: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     pdf_generated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    pdf_content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     payment_reminder_before_sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     payment_reminder_due_today_sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     payment_reminder_after_sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -2,46 +2,107 @@
 import os
 import re
 import io
+import sys
 import json
+import hashlib
 import textwrap
+import threading
+from collections import OrderedDict
+from types import MappingProxyType, SimpleNamespace
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.utils import ImageReader
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.platypus import Paragraph
 
+from sqlalchemy.orm import joinedload, selectinload
+
 from config import Config
 from models import Invoice, User, Customer, InvoiceDesignTemplate
 
+# Load the Helvetica metrics every invoice layout uses at import time rather
+# than on the first render.
+for _font_name in ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Helvetica-BoldOblique"):
+    pdfmetrics.getFont(_font_name)
+del _font_name
+
+# Widest glyph advance in Helvetica (per 1pt of font size). Any ASCII string
+# whose length times this fits the column is guaranteed not to wrap.
+_HELVETICA_MAX_ADVANCE = max(pdfmetrics.getFont("Helvetica").widths) / 1000.0
+
+_MONEY_FMT = "${:,.2f}".format
+
+
+@lru_cache(maxsize=1024)
+def _money_cached(x: float) -> str:
+    return _MONEY_FMT(x)
+
 
 def _money(x) -> str:
+    # Invoices repeat the same handful of amounts (rate, subtotal, total, due),
+    # so formatted strings are cached. Adding 0.0 folds -0.0 into 0.0 so the
+    # cached text does not depend on which one was formatted first.
+    if type(x) is float:
+        return _money_cached(x + 0.0)
     try:
-        return f"${float(x):,.2f}"
+        return _money_cached(float(x) + 0.0)
     except Exception:
         return f"${x}"
 
 
+def _to_float(v, d: float = 0.0) -> float:
+    t = type(v)
+    if t is float:
+        return v
+    if t is int:
+        return float(v)
+    if v is None:
+        return d
+    try:
+        return float(v)
+    except (TypeError, ValueError, OverflowError):
+        return d
+
+
+def _coalesce(*vals) -> str:
+    """First value that is not blank once stripped, or ""."""
+    for v in vals:
+        v = (v or "").strip()
+        if v:
+            return v
+    return ""
+
+
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[\\/*?:"<>|]')
+_NON_DIGIT_RE = re.compile(r"\D")
+_PAREN_SPACES_RE = re.compile(r"\)\s+")
+_HEX_COLOR_RE = re.compile(r"#[0-9a-fA-F]{6}")
+
+
 def _safe_filename(name: str) -> str:
     # strip characters not allowed on Windows/mac paths
-    return re.sub(r'[\\/*?:"<>|]', "", (name or "")).strip() or "Invoice"
+    return _UNSAFE_FILENAME_CHARS_RE.sub("", (name or "")).strip() or "Invoice"
 
 
 def _format_phone(phone: str | None) -> str:
     raw = (phone or "").strip()
     if not raw:
         return ""
-    digits = re.sub(r"\D", "", raw)
+    digits = _NON_DIGIT_RE.sub("", raw)
     if len(digits) == 10:
         return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
     if len(digits) == 11 and digits.startswith("1"):
         return f"+1 ({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
-    return re.sub(r"\)\s+", ") ", raw)
+    return _PAREN_SPACES_RE.sub(") ", raw)
 
 
 def _city_state_postal_line(city: str | None, state: str | None, postal_code: str | None) -> str:
@@ -105,7 +166,37 @@ def _business_header_display_name(owner: User | None, fallback: str = "InvoiceRu
     return _business_header_name(owner) or fallback
 
 
+# Owner fields _business_header_info_lines reads; together they key its memo.
+_HEADER_INFO_FIELDS = (
+    "show_business_address",
+    "show_business_phone",
+    "show_business_email",
+    "address_line1",
+    "address_line2",
+    "city",
+    "state",
+    "postal_code",
+    "address",
+    "phone",
+    "email",
+)
+_MISSING = object()
+
+
 def _business_header_info_lines(owner: User | None) -> list[str]:
+    if not owner:
+        return []
+    # Keyed on the field values themselves (not owner.updated_at), so edits that
+    # are not committed yet, e.g. in a settings preview, are never served stale.
+    fields = tuple(getattr(owner, name, _MISSING) for name in _HEADER_INFO_FIELDS)
+    return list(_business_header_info_lines_for(fields))
+
+
+@lru_cache(maxsize=512)
+def _business_header_info_lines_for(fields: tuple) -> tuple[str, ...]:
+    owner = SimpleNamespace(**{
+        name: value for name, value in zip(_HEADER_INFO_FIELDS, fields) if value is not _MISSING
+    })
     lines: list[str] = []
     if _show_business_address(owner):
         lines.extend(_owner_address_lines(owner))
@@ -117,7 +208,7 @@ def _business_header_info_lines(owner: User | None) -> list[str]:
         email = (getattr(owner, "email", None) or "").strip() if owner else ""
         if email:
             lines.append(email)
-    return lines
+    return tuple(lines)
 
 
 FREE_INVOICE_TEMPLATES = {
@@ -223,7 +314,7 @@ def _generate_free_repair_pdf(data: dict) -> bytes:
     ]
 
     buf = io.BytesIO()
-    pdf = canvas.Canvas(buf, pagesize=LETTER)
+    pdf = canvas.Canvas(buf, pagesize=LETTER, pageCompression=1)
     page_w, page_h = LETTER
     margin = 0.65 * inch
     content_w = page_w - (margin * 2)
@@ -253,11 +344,11 @@ def _generate_free_repair_pdf(data: dict) -> bytes:
         return lines
 
     def draw_logo(x: float, top_y: float, *, box_w=0.9 * inch, box_h=0.9 * inch) -> float:
-        if not logo_bytes:
+        logo = _owner_logo_image(logo_bytes, None)
+        if logo is None:
             return 0.0
         try:
-            logo_reader = ImageReader(io.BytesIO(logo_bytes))
-            pdf.drawImage(logo_reader, x, top_y - box_h, width=box_w, height=box_h, preserveAspectRatio=True, mask="auto")
+            pdf.drawImage(logo[0], x, top_y - box_h, width=box_w, height=box_h, preserveAspectRatio=True, mask="auto")
             return box_w + 12
         except Exception:
             return 0.0
@@ -596,7 +687,7 @@ def generate_free_repair_order_pdf(data: dict) -> bytes:
     logo_bytes = payload.get("logo_bytes")
 
     buf = io.BytesIO()
-    pdf = canvas.Canvas(buf, pagesize=LETTER)
+    pdf = canvas.Canvas(buf, pagesize=LETTER, pageCompression=1)
     page_w, page_h = LETTER
     margin = 0.65 * inch
     content_w = page_w - (margin * 2)
@@ -609,11 +700,11 @@ def generate_free_repair_order_pdf(data: dict) -> bytes:
     ] if show_branding else []
 
     def draw_logo(x: float, top_y: float, *, box_w=0.88 * inch, box_h=0.88 * inch) -> float:
-        if not logo_bytes:
+        logo = _owner_logo_image(logo_bytes, None)
+        if logo is None:
             return 0.0
         try:
-            logo_reader = ImageReader(io.BytesIO(logo_bytes))
-            pdf.drawImage(logo_reader, x, top_y - box_h, width=box_w, height=box_h, preserveAspectRatio=True, mask="auto")
+            pdf.drawImage(logo[0], x, top_y - box_h, width=box_w, height=box_h, preserveAspectRatio=True, mask="auto")
             return box_w + 12
         except Exception:
             return 0.0
@@ -884,7 +975,7 @@ def generate_free_receipt_pdf(data: dict) -> bytes:
     logo_bytes = payload.get("logo_bytes")
 
     buf = io.BytesIO()
-    pdf = canvas.Canvas(buf, pagesize=LETTER)
+    pdf = canvas.Canvas(buf, pagesize=LETTER, pageCompression=1)
     page_w, page_h = LETTER
     margin = 0.65 * inch
     content_w = page_w - (margin * 2)
@@ -897,11 +988,11 @@ def generate_free_receipt_pdf(data: dict) -> bytes:
     ] if show_branding else []
 
     def draw_logo(x: float, top_y: float, *, box_w=0.88 * inch, box_h=0.88 * inch) -> float:
-        if not logo_bytes:
+        logo = _owner_logo_image(logo_bytes, None)
+        if logo is None:
             return 0.0
         try:
-            logo_reader = ImageReader(io.BytesIO(logo_bytes))
-            pdf.drawImage(logo_reader, x, top_y - box_h, width=box_w, height=box_h, preserveAspectRatio=True, mask="auto")
+            pdf.drawImage(logo[0], x, top_y - box_h, width=box_w, height=box_h, preserveAspectRatio=True, mask="auto")
             return box_w + 12
         except Exception:
             return 0.0
@@ -1345,6 +1436,26 @@ def _invoice_paid_total_with_processing(inv: Invoice) -> float:
     return round(max(0.0, paid_base + _invoice_processing_fee_paid(inv) + _invoice_tip_paid(inv)), 2)
 
 
+def _part_prices_with_markup(inv: Invoice, parts) -> list[float]:
+    """Per-part prices with markup, rounded like Invoice.part_price_with_markup()."""
+    markup_percent = inv.parts_markup_percent or 0.0
+    if not markup_percent:
+        return [float(inv._money(p.part_price or 0.0)) for p in parts]
+    multiplier = inv._dec(1) + (inv._dec(markup_percent) / inv._dec(100))
+    return [float(inv._money(inv._dec(p.part_price or 0.0) * multiplier)) for p in parts]
+
+
+def _part_prices_and_total(inv: Invoice, parts) -> tuple[list[float], float]:
+    """Per-part marked-up prices plus the parts total, matching Invoice.parts_total()."""
+    markup_percent = inv.parts_markup_percent or 0.0
+    if not markup_percent:
+        prices = [float(inv._money(p.part_price or 0.0)) for p in parts]
+        return prices, float(inv._money(sum(inv._dec(p.part_price) for p in parts)))
+    multiplier = inv._dec(1) + (inv._dec(markup_percent) / inv._dec(100))
+    line_totals = [inv._money(inv._dec(p.part_price) * multiplier) for p in parts]
+    return [float(t) for t in line_totals], float(inv._money(sum(line_totals, inv._dec(0))))
+
+
 def _tax_label(inv: Invoice) -> str:
     if getattr(inv, "tax_override", None) is not None:
         return "Tax"
@@ -1354,8 +1465,154 @@ def _tax_label(inv: Invoice) -> str:
     return "Tax"
 
 
-def _wrap_text(text, font, size, max_width):
-    words = str(text).split()
+class _StateTrackingCanvas(canvas.Canvas):
+    """Canvas that skips font/color/line-width operators that would not change the current state."""
+
+    def setFont(self, psfontname, size, leading=None):
+        if leading is None:
+            leading = size * 1.2
+        if psfontname == self._fontname and size == self._fontsize and leading == self._leading:
+            return
+        super().setFont(psfontname, size, leading)
+
+    def setFillColor(self, aColor, alpha=None):
+        if alpha is None and aColor == self._fillColorObj:
+            return
+        super().setFillColor(aColor, alpha=alpha)
+
+    def setStrokeColor(self, aColor, alpha=None):
+        if alpha is None and aColor == self._strokeColorObj:
+            return
+        super().setStrokeColor(aColor, alpha=alpha)
+
+    def setLineWidth(self, width):
+        if width == self._lineWidth:
+            return
+        super().setLineWidth(width)
+
+    def drawText(self, aTextObject):
+        super().drawText(aTextObject)
+        # Tf / TL / rg set inside BT..ET persist, so mirror them back onto the canvas.
+        self._fontname = aTextObject._fontname
+        self._fontsize = aTextObject._fontsize
+        self._leading = aTextObject._leading
+        fill = getattr(aTextObject, "_fillColorObj", None)
+        if fill is not None:
+            self._fillColorObj = fill
+        stroke = getattr(aTextObject, "_strokeColorObj", None)
+        if stroke is not None:
+            self._strokeColorObj = stroke
+
+
+def _save_pdf(pdf, pdf_path: str, out_stream=None) -> None:
+    """Finish the canvas into pdf_path, and also into out_stream when one is given.
+
+    ReportLab builds the whole document in memory and writes it with a single
+    write() (no seeks), so rendering into a BytesIO first would only add a copy.
+    """
+    if out_stream is None:
+        pdf.save()
+        return
+    data = pdf.getpdfdata()
+    with open(pdf_path, "wb") as fh:
+        fh.write(data)
+    out_stream.write(data)
+
+
+def _draw_text_lines(pdf, x: float, y: float, lines, leading: float) -> float:
+    """Draw left-aligned lines as one text object; returns the baseline below the last line."""
+    if not lines:
+        return y
+    text = pdf.beginText(x, y)
+    text.setLeading(leading)
+    for ln in lines:
+        text.textLine(ln)
+    pdf.drawText(text)
+    return y - (leading * len(lines))
+
+
+_LOGO_CACHE_SIZE = 64
+_logo_cache: "OrderedDict[tuple, tuple[ImageReader, int, int]]" = OrderedDict()
+_logo_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=512)
+def _instance_logo_path(logo_rel: str) -> str:
+    """Absolute path of a logo stored relative to instance/; resolve() walks every path component."""
+    return str((Path("instance") / logo_rel).resolve())
+
+
+def _owner_logo_image(owner_logo_blob: bytes | None, owner_logo_abs: str | None):
+    """Return a cached (ImageReader, width, height) for the owner logo, or None."""
+    if owner_logo_blob:
+        key = ("blob", hashlib.blake2b(owner_logo_blob, digest_size=8).digest(), len(owner_logo_blob))
+    elif owner_logo_abs:
+        try:
+            key = ("path", owner_logo_abs, os.path.getmtime(owner_logo_abs))
+        except OSError:
+            return None
+    else:
+        return None
+
+    with _logo_cache_lock:
+        hit = _logo_cache.get(key)
+        if hit is not None:
+            _logo_cache.move_to_end(key)
+            return hit
+
+    try:
+        img = ImageReader(io.BytesIO(owner_logo_blob) if owner_logo_blob else owner_logo_abs)
+        iw, ih = img.getSize()
+    except Exception:
+        # An undecodable blob still falls back to the logo file, if there is one.
+        if owner_logo_blob and owner_logo_abs:
+            return _owner_logo_image(None, owner_logo_abs)
+        return None
+    entry = (img, iw, ih)
+    with _logo_cache_lock:
+        _logo_cache[key] = entry
+        while len(_logo_cache) > _LOGO_CACHE_SIZE:
+            _logo_cache.popitem(last=False)
+    return entry
+
+
+def _draw_logo(pdf, owner_logo, x, cy, max_w, max_h) -> float:
+    """Draw the owner logo (as returned by _owner_logo_image) scaled into
+    max_w x max_h, vertically centred on cy.
+
+    Returns the drawn width, or 0 when there is no usable logo.
+    """
+    if owner_logo is None:
+        return 0
+    try:
+        img, iw, ih = owner_logo
+        scale = min(max_w / float(iw), max_h / float(ih))
+        w = float(iw) * scale
+        h = float(ih) * scale
+        pdf.drawImage(img, x, cy - (h / 2), width=w, height=h, mask="auto")
+    except Exception:
+        return 0
+    return w
+
+
+def _wrap_text(text, font, size, max_width, max_lines: int | None = None):
+    # Callers are free to extend/slice the result, so hand out a fresh list.
+    # max_lines stops wrapping once that many lines are complete; the result
+    # equals the full wrap truncated to max_lines.
+    return list(_wrap_text_cached(str(text), font, size, max_width, max_lines))
+
+
+@lru_cache(maxsize=4096)
+def _wrap_text_cached(text: str, font, size, max_width, max_lines: int | None = None) -> tuple[str, ...]:
+    """Memoized word wrap; the same labels, addresses and notes recur across rows and invoices."""
+    words = text.split()
+    if not words:
+        return ("",)
+    # Most cells fit on one line: measure the whole (single-spaced) string once and
+    # skip tokenizing. Widths are additive, so this agrees exactly with the loop below.
+    one_line = " ".join(words)
+    if _text_units(one_line, font) * 0.001 * size <= max_width:
+        return (one_line,)
     lines = []
     current = ""
 
@@ -1380,21 +1637,39 @@ def _wrap_text(text, font, size, max_width):
             remaining = remaining[fit:]
         return chunks
 
-    expanded_words = []
-    for w in words:
-        expanded_words.extend(split_long_token(w))
-
-    for w in expanded_words:
-        test = current + (" " if current else "") + w
-        if stringWidth(test, font, size) <= max_width:
-            current = test
-        else:
-            if current:
-                lines.append(current)
-            current = w
+    # Type 1 widths are integer glyph units summed then scaled by size/1000, so
+    # the candidate line's width can be accumulated word by word instead of
+    # re-measuring the whole line each time; the comparison stays exact.
+    space_units = _text_units(" ", font)
+    current_units = 0
+    for token in words:
+        for w in split_long_token(token):
+            w_units = _text_units(w, font)
+            test_units = current_units + space_units + w_units if current else w_units
+            if test_units * 0.001 * size <= max_width:
+                current = current + " " + w if current else w
+                current_units = test_units
+            else:
+                if current:
+                    lines.append(current)
+                    if max_lines is not None and len(lines) >= max_lines:
+                        return tuple(lines)
+                current = w
+                current_units = w_units
     if current:
         lines.append(current)
-    return lines or [""]
+    return tuple(lines) or ("",)
+
+
+def _text_units(text: str, font) -> int:
+    """Unscaled glyph-unit width of text (stringWidth at 1000pt, without float noise)."""
+    return round(stringWidth(text, font, 1000))
+
+
+@lru_cache(maxsize=4096)
+def _string_width(text: str, font, size) -> float:
+    """Memoized stringWidth; amounts and labels are right-aligned over and over across rows and invoices."""
+    return stringWidth(text, font, size)
 
 
 def _wrap_text_preserve_spaces(text, font, size, max_width):
@@ -1528,10 +1803,7 @@ def _builder_template_vars(
     rate_val = float(getattr(inv, "price_per_hour", 0.0) or 0.0)
     labor_lines: list[str] = []
     for li in getattr(inv, "labor_items", []) or []:
-        try:
-            t = float(li.labor_time_hours or 0.0)
-        except Exception:
-            t = 0.0
+        t = _to_float(li.labor_time_hours)
         line_total = t * rate_val
         desc = (li.labor_desc or "").strip() or "Labor Item"
         if t > 0:
@@ -1603,9 +1875,12 @@ def _render_invoice_builder_pdf(
     is_estimate: bool,
     design_obj: dict,
     cfg: dict | None = None,
+    owner_logo: tuple[ImageReader, int, int] | None = None,
+    out_stream=None,
+    commit: bool = True,
 ) -> str:
     PAGE_W, PAGE_H = LETTER
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = canvas.Canvas(pdf_path, pagesize=LETTER, pageCompression=1)
     display_no = getattr(inv, "display_number", None) or inv.invoice_number
     doc_label = "Estimate" if is_estimate else "Invoice"
     pdf.setTitle(f"{doc_label} - {display_no}")
@@ -1614,7 +1889,7 @@ def _render_invoice_builder_pdf(
     canvas_w = float((canvas_cfg or {}).get("width") or 816.0)
     canvas_h = float((canvas_cfg or {}).get("height") or 1056.0)
     canvas_bg = str((canvas_cfg or {}).get("bg") or "#ffffff")
-    if not re.fullmatch(r"#[0-9a-fA-F]{6}", canvas_bg):
+    if not _HEX_COLOR_RE.fullmatch(canvas_bg):
         canvas_bg = "#ffffff"
     scale_x = PAGE_W / max(1.0, canvas_w)
     scale_y = PAGE_H / max(1.0, canvas_h)
@@ -1623,22 +1898,7 @@ def _render_invoice_builder_pdf(
     pdf.rect(0, 0, PAGE_W, PAGE_H, stroke=0, fill=1)
 
     vars_map = _builder_template_vars(inv, owner, customer, is_estimate=is_estimate, cfg=cfg)
-    owner_logo_blob = getattr(owner, "logo_blob", None) if owner else None
-    owner_logo_abs = ""
-    owner_logo_rel = (getattr(owner, "logo_path", None) or "").strip() if owner else ""
-    if owner_logo_rel:
-        owner_logo_abs = str((Path("instance") / owner_logo_rel).resolve())
-    logo_reader = None
-    if owner_logo_blob:
-        try:
-            logo_reader = ImageReader(io.BytesIO(owner_logo_blob))
-        except Exception:
-            logo_reader = None
-    if logo_reader is None and owner_logo_abs and os.path.exists(owner_logo_abs):
-        try:
-            logo_reader = ImageReader(owner_logo_abs)
-        except Exception:
-            logo_reader = None
+    logo_reader = owner_logo[0] if owner_logo is not None else None
     elements = design_obj.get("elements") if isinstance(design_obj, dict) else []
     if not isinstance(elements, list):
         elements = []
@@ -2092,15 +2352,15 @@ def _render_invoice_builder_pdf(
         radius = float(el.get("radius") or 0.0) * min(scale_x, scale_y)
 
         if etype == "box":
-            has_fill = re.fullmatch(r"#[0-9a-fA-F]{6}", fill_color or "") is not None
-            has_stroke = re.fullmatch(r"#[0-9a-fA-F]{6}", border_color or "") is not None
+            has_fill = _HEX_COLOR_RE.fullmatch(fill_color or "") is not None
+            has_stroke = _HEX_COLOR_RE.fullmatch(border_color or "") is not None
             pdf.setFillColor(colors.HexColor(fill_color if has_fill else "#ffffff"))
             pdf.setStrokeColor(colors.HexColor(border_color if has_stroke else "#111827"))
             pdf.roundRect(rx, ry, rw, rh, max(0.0, radius), stroke=1 if has_stroke else 0, fill=1 if has_fill else 0)
             continue
         if etype == "image":
-            has_fill = re.fullmatch(r"#[0-9a-fA-F]{6}", fill_color or "") is not None
-            has_stroke = re.fullmatch(r"#[0-9a-fA-F]{6}", border_color or "") is not None
+            has_fill = _HEX_COLOR_RE.fullmatch(fill_color or "") is not None
+            has_stroke = _HEX_COLOR_RE.fullmatch(border_color or "") is not None
             if has_fill:
                 pdf.setFillColor(colors.HexColor(fill_color))
                 pdf.roundRect(rx, ry, rw, rh, max(0.0, radius), stroke=0, fill=1)
@@ -2198,11 +2458,11 @@ def _render_invoice_builder_pdf(
         text_align = str(el.get("textAlign") or "left").strip().lower()
         underline = bool(el.get("underline", False))
         font_name = _builder_font_name(font_family, font_weight, font_style)
-        if re.fullmatch(r"#[0-9a-fA-F]{6}", text_color or ""):
+        if _HEX_COLOR_RE.fullmatch(text_color or ""):
             pdf.setFillColor(colors.HexColor(text_color))
         else:
             pdf.setFillColor(colors.black)
-        if re.fullmatch(r"#[0-9a-fA-F]{6}", text_color or ""):
+        if _HEX_COLOR_RE.fullmatch(text_color or ""):
             pdf.setStrokeColor(colors.HexColor(text_color))
         else:
             pdf.setStrokeColor(colors.black)
@@ -2251,7 +2511,7 @@ def _render_invoice_builder_pdf(
                 fontName=font_name,
                 fontSize=font_size,
                 leading=line_h,
-                textColor=colors.HexColor(text_color) if re.fullmatch(r"#[0-9a-fA-F]{6}", text_color or "") else colors.black,
+                textColor=colors.HexColor(text_color) if _HEX_COLOR_RE.fullmatch(text_color or "") else colors.black,
                 alignment=align_code,
             )
             try:
@@ -2298,11 +2558,11 @@ def _render_invoice_builder_pdf(
             used = _draw_table_box(kind, cont_x, cont_y, cont_w, cont_h, remaining, cont=True)
             remaining = remaining[used:]
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
     return pdf_path
 
 
@@ -2322,15 +2582,16 @@ def _render_modern_pdf(
     doc_label: str,
     generated_dt: datetime,
     generated_str: str,
-    owner_logo_abs: str,
-    owner_logo_blob: bytes | None,
+    owner_logo: tuple[ImageReader, int, int] | None,
     is_estimate: bool,
     builder_cfg: dict | None = None,
+    out_stream=None,
+    commit: bool = True,
 ):
     PAGE_W, PAGE_H = LETTER
     M = 0.65 * inch
 
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = canvas.Canvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"{doc_label.title()} - {display_no}")
     builder_enabled = bool(builder_cfg.get("enabled", False)) if isinstance(builder_cfg, dict) else False
     builder_accent = colors.HexColor(
@@ -2354,8 +2615,8 @@ def _render_modern_pdf(
     def right_text(x, y, text, font="Helvetica", size=10, color=colors.black):
         pdf.setFont(font, size)
         pdf.setFillColor(color)
-        w = pdf.stringWidth(str(text), font, size)
-        pdf.drawString(x - w, y, str(text))
+        s = str(text)
+        pdf.drawString(x - _string_width(s, font, size), y, s)
 
     def label_right_value(x_left, x_right, y, label, value, label_font=("Helvetica-Bold", 9), value_font=("Helvetica", 10)):
         pdf.setFont(*label_font)
@@ -2368,41 +2629,15 @@ def _render_modern_pdf(
     show_parts = bool(cfg.get("show_parts", True))
     show_shop_supplies = bool(cfg.get("show_shop_supplies", True))
     show_notes = bool(cfg.get("show_notes", True))
+    labor_title = cfg["labor_title"]
+    parts_title = cfg["parts_title"]
 
     header_h = 1.35 * inch
     pdf.setFillColor(brand_dark)
     pdf.rect(0, PAGE_H - header_h, PAGE_W, header_h, stroke=0, fill=1)
 
     # Optional logo
-    logo_w = 0
-    if owner_logo_blob:
-        try:
-            img = ImageReader(io.BytesIO(owner_logo_blob))
-            iw, ih = img.getSize()
-            max_h = 0.5 * inch
-            max_w = 1.4 * inch
-            scale = min(max_w / iw, max_h / ih)
-            logo_w = iw * scale
-            logo_h = ih * scale
-            logo_x = M
-            logo_y = PAGE_H - (header_h / 2) - (logo_h / 2)
-            pdf.drawImage(img, logo_x, logo_y, width=logo_w, height=logo_h, mask="auto")
-        except Exception:
-            logo_w = 0
-    elif owner_logo_abs and os.path.exists(owner_logo_abs):
-        try:
-            img = ImageReader(owner_logo_abs)
-            iw, ih = img.getSize()
-            max_h = 0.5 * inch
-            max_w = 1.4 * inch
-            scale = min(max_w / float(iw), max_h / float(ih))
-            logo_w = float(iw) * scale
-            logo_h = float(ih) * scale
-            logo_x = M
-            logo_y = PAGE_H - (header_h / 2) - (logo_h / 2)
-            pdf.drawImage(img, logo_x, logo_y, width=logo_w, height=logo_h, mask="auto")
-        except Exception:
-            logo_w = 0
+    logo_w = _draw_logo(pdf, owner_logo, M, PAGE_H - (header_h / 2), 1.4 * inch, 0.5 * inch)
 
     header_name = _business_header_name(owner)
     header_info_lines = _business_header_info_lines(owner)
@@ -2557,15 +2792,14 @@ def _render_modern_pdf(
         pdf.setFont("Helvetica", 10)
         pdf.setFillColor(colors.black)
 
+        # Wrap every row up front so the drawing loop below only lays out text.
+        plan = []
         for row in rows:
-            wrapped_cells = []
-            row_height = base_row_h
-            for i, cell in enumerate(row):
-                max_w = col_widths[i] - 16
-                lines = _wrap_text(cell, "Helvetica", 10, max_w)
-                wrapped_cells.append(lines)
-                row_height = max(row_height, len(lines) * base_row_h)
+            wrapped_cells = [_wrap_text(cell, "Helvetica", 10, col_widths[i] - 16) for i, cell in enumerate(row)]
+            row_height = max([base_row_h] + [len(lines) * base_row_h for lines in wrapped_cells])
+            plan.append((wrapped_cells, row_height))
 
+        for wrapped_cells, row_height in plan:
             if (y_cursor - row_height) < min_content_y:
                 next_top = _start_cont_page()
                 y_cursor = draw_table_header(f"{title} (cont.)", next_top)
@@ -2594,23 +2828,22 @@ def _render_modern_pdf(
     body_y = top_y - box_h - 0.45 * inch
 
     labor_rows = []
+    has_labor_rows = False
     rate = float(inv.price_per_hour or 0.0)
+    hours_suffix = cfg.get("hours_suffix", "hrs")
     for li in inv.labor_items:
-        try:
-            t = float(li.labor_time_hours or 0.0)
-        except Exception:
-            t = 0.0
+        t = _to_float(li.labor_time_hours)
         line_total = t * rate
-        labor_rows.append([
-            li.labor_desc or "",
-            f"{t:g} {cfg.get('hours_suffix', 'hrs')}" if t else "",
-            _money(line_total) if line_total else ""
-        ])
+        labor_desc = li.labor_desc or ""
+        time_txt = f"{t:g} {hours_suffix}" if t else ""
+        total_txt = _money(line_total) if line_total else ""
+        if labor_desc or time_txt or total_txt:
+            has_labor_rows = True
+        labor_rows.append([labor_desc, time_txt, total_txt])
 
-    has_labor_rows = any((row[0] or row[1] or row[2]) for row in labor_rows)
     if show_labor and has_labor_rows:
         body_y = draw_table(
-            cfg["labor_title"],
+            labor_title,
             M,
             body_y,
             [cfg["labor_desc_label"], cfg.get("labor_time_label", "Time"), cfg.get("labor_total_label", "Line Total")],
@@ -2620,16 +2853,17 @@ def _render_modern_pdf(
         )
 
     parts_rows = []
-    for p in inv.parts:
-        parts_rows.append([
-            p.part_name or "",
-            _money(inv.part_price_with_markup(p.part_price or 0.0)) if (p.part_price or 0.0) else ""
-        ])
+    has_parts_rows = False
+    for p, price in zip(inv.parts, _part_prices_with_markup(inv, inv.parts)):
+        part_name = p.part_name or ""
+        price_txt = _money(price) if (p.part_price or 0.0) else ""
+        if part_name or price_txt:
+            has_parts_rows = True
+        parts_rows.append([part_name, price_txt])
 
-    has_parts_rows = any((row[0] or row[1]) for row in parts_rows)
     if show_parts and has_parts_rows:
         body_y = draw_table(
-            cfg["parts_title"],
+            parts_title,
             M,
             body_y - 10,
             [cfg["parts_name_label"], cfg.get("parts_price_label", "Price")],
@@ -2661,15 +2895,14 @@ def _render_modern_pdf(
     payment_methods_h = _payment_methods_footer_height(owner, PAGE_W - (2 * M)) if not is_estimate else 0.0
     page_bottom_limit = footer_y + footer_clearance + payment_methods_h
 
-    needed_text_h = 0
-    for ln in all_note_lines:
-        needed_text_h += SPACER_GAP if ln == "__SPACER__" else line_height
+    spacer_count = all_note_lines.count("__SPACER__")
+    needed_text_h = spacer_count * SPACER_GAP + (len(all_note_lines) - spacer_count) * line_height
     needed_box_h = header_title_gap + needed_text_h + bottom_padding
 
     max_box_h_this_page = notes_y_top - page_bottom_limit
     notes_box_h = min(max_box_h_this_page, needed_box_h) if show_notes else 0
 
-    remaining_lines = []
+    notes_idx = 0
     if show_notes:
         pdf.setFillColor(soft_bg)
         pdf.roundRect(M, notes_y_top - notes_box_h, notes_box_w, notes_box_h, 10, stroke=1, fill=1)
@@ -2695,7 +2928,7 @@ def _render_modern_pdf(
                 y_note -= line_height
             lines_fit += 1
 
-        remaining_lines = all_note_lines[lines_fit:]
+        notes_idx = lines_fit
 
     sum_x = PAGE_W - M - 240
     sum_w = 240
@@ -2719,9 +2952,9 @@ def _render_modern_pdf(
     y = notes_y_top - 44
 
     if show_parts and has_parts_rows and total_parts:
-        label_right_value(sum_x + 12, right_edge, y, f"{cfg['parts_title']}:", _money(total_parts)); y -= 16
+        label_right_value(sum_x + 12, right_edge, y, f"{parts_title}:", _money(total_parts)); y -= 16
     if show_labor and has_labor_rows and total_labor:
-        label_right_value(sum_x + 12, right_edge, y, f"{cfg['labor_title']}:", _money(total_labor)); y -= 16
+        label_right_value(sum_x + 12, right_edge, y, f"{labor_title}:", _money(total_labor)); y -= 16
     if show_shop_supplies and inv.shop_supplies:
         label_right_value(sum_x + 12, right_edge, y, f"{cfg['shop_supplies_label']}:", _money(inv.shop_supplies)); y -= 16
     if tax_amount:
@@ -2778,9 +3011,9 @@ def _render_modern_pdf(
         pdf.setFillColor(brand_muted)
         pdf.drawString(M, PAGE_H - 0.62 * inch, f"{display_no}  •  Generated: {generated_str}")
 
-    if show_notes and remaining_lines:
+    if show_notes and notes_idx < len(all_note_lines):
         footer()
-        while remaining_lines:
+        while notes_idx < len(all_note_lines):
             start_new_page_with_header()
 
             notes_y_top_2 = PAGE_H - (M + 0.6 * inch)
@@ -2801,7 +3034,7 @@ def _render_modern_pdf(
             bottom2 = notes_y_top_2 - notes_box_h_2 + bottom_padding
 
             fit2 = 0
-            for line in remaining_lines:
+            for line in islice(all_note_lines, notes_idx, None):
                 if y_note2 < bottom2:
                     break
                 if line == "__SPACER__":
@@ -2811,17 +3044,17 @@ def _render_modern_pdf(
                     y_note2 -= line_height
                 fit2 += 1
 
-            remaining_lines = remaining_lines[fit2:]
+            notes_idx += fit2
             footer()
     else:
         footer()
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
 
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
 
     return pdf_path
 
@@ -2842,15 +3075,16 @@ def _render_split_panel_pdf(
     doc_label: str,
     generated_dt: datetime,
     generated_str: str,
-    owner_logo_abs: str,
-    owner_logo_blob: bytes | None,
+    owner_logo: tuple[ImageReader, int, int] | None,
     is_estimate: bool,
     builder_cfg: dict | None = None,
+    out_stream=None,
+    commit: bool = True,
 ):
     PAGE_W, PAGE_H = LETTER
     M = 0.55 * inch
 
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = canvas.Canvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"{doc_label.title()} - {display_no}")
     builder_enabled = bool(builder_cfg.get("enabled", False)) if isinstance(builder_cfg, dict) else False
     builder_accent = colors.HexColor(
@@ -2874,8 +3108,8 @@ def _render_split_panel_pdf(
     def right_text(x, y, text, font="Helvetica", size=10, color=colors.black):
         pdf.setFont(font, size)
         pdf.setFillColor(color)
-        w = pdf.stringWidth(str(text), font, size)
-        pdf.drawString(x - w, y, str(text))
+        s = str(text)
+        pdf.drawString(x - _string_width(s, font, size), y, s)
 
     def label_right_value(x_left, x_right, y, label, value, label_font=("Helvetica-Bold", 9), value_font=("Helvetica", 10)):
         pdf.setFont(*label_font)
@@ -2888,6 +3122,8 @@ def _render_split_panel_pdf(
     show_parts = bool(cfg.get("show_parts", True))
     show_shop_supplies = bool(cfg.get("show_shop_supplies", True))
     show_notes = bool(cfg.get("show_notes", True))
+    labor_title = cfg["labor_title"]
+    parts_title = cfg["parts_title"]
 
     # Left summary rail
     rail_w = 1.55 * inch
@@ -2902,24 +3138,9 @@ def _render_split_panel_pdf(
     logo_y_top = PAGE_H - M - 36
     logo_drawn = False
     logo_h_drawn = 0.0
-    if owner_logo_blob:
+    if owner_logo is not None:
         try:
-            img = ImageReader(io.BytesIO(owner_logo_blob))
-            iw, ih = img.getSize()
-            max_h = 0.55 * inch
-            max_w = rail_w - 24
-            scale = min(max_w / iw, max_h / ih)
-            w = iw * scale
-            h = ih * scale
-            pdf.drawImage(img, logo_x, logo_y_top - h, width=w, height=h, mask="auto")
-            logo_drawn = True
-            logo_h_drawn = h
-        except Exception:
-            logo_drawn = False
-    elif owner_logo_abs and os.path.exists(owner_logo_abs):
-        try:
-            img = ImageReader(owner_logo_abs)
-            iw, ih = img.getSize()
+            img, iw, ih = owner_logo
             max_h = 0.55 * inch
             max_w = rail_w - 24
             scale = min(max_w / float(iw), max_h / float(ih))
@@ -2941,7 +3162,7 @@ def _render_split_panel_pdf(
         name_y = logo_y_top - logo_h_drawn - 10
     else:
         name_y = logo_y_top - 0.1 * inch
-    for ln in _wrap_text(header_name, "Helvetica-Bold", 10, rail_w - 20)[:2]:
+    for ln in _wrap_text(header_name, "Helvetica-Bold", 10, rail_w - 20, max_lines=2):
         pdf.drawString(rail_x + 12, name_y, ln)
         name_y -= 12
 
@@ -2967,9 +3188,9 @@ def _render_split_panel_pdf(
     pdf.setFont("Helvetica", 9)
     y = rail_y + 125
     if show_labor and total_labor:
-        pdf.drawString(rail_x + 12, y, f"{cfg['labor_title']}: {_money(total_labor)}"); y -= 14
+        pdf.drawString(rail_x + 12, y, f"{labor_title}: {_money(total_labor)}"); y -= 14
     if show_parts and total_parts:
-        pdf.drawString(rail_x + 12, y, f"{cfg['parts_title']}: {_money(total_parts)}"); y -= 14
+        pdf.drawString(rail_x + 12, y, f"{parts_title}: {_money(total_parts)}"); y -= 14
     if show_shop_supplies and inv.shop_supplies:
         pdf.drawString(rail_x + 12, y, f"{cfg['shop_supplies_label']}: {_money(inv.shop_supplies)}"); y -= 14
     if tax_amount:
@@ -3068,7 +3289,7 @@ def _render_split_panel_pdf(
     if customer_phone:
         pdf.drawString(card1_x + 12, y_cursor, f"Phone: {customer_phone}"); y_cursor -= 12
     if customer_email:
-        for ln in _wrap_text(f"Email: {customer_email}", "Helvetica", 9, card_w - 24)[:2]:
+        for ln in _wrap_text(f"Email: {customer_email}", "Helvetica", 9, card_w - 24, max_lines=2):
             pdf.drawString(card1_x + 12, y_cursor, ln); y_cursor -= 12
     for ln in addr_lines[:2]:
         pdf.drawString(card1_x + 12, y_cursor, ln); y_cursor -= 12
@@ -3131,15 +3352,14 @@ def _render_split_panel_pdf(
         pdf.setFont("Helvetica", 10)
         pdf.setFillColor(colors.black)
 
+        # Wrap every row up front so the drawing loop below only lays out text.
+        plan = []
         for row in rows:
-            wrapped_cells = []
-            row_height = base_row_h
-            for i, cell in enumerate(row):
-                max_w = col_widths[i] - 16
-                lines = _wrap_text(cell, "Helvetica", 10, max_w)
-                wrapped_cells.append(lines)
-                row_height = max(row_height, len(lines) * base_row_h)
+            wrapped_cells = [_wrap_text(cell, "Helvetica", 10, col_widths[i] - 16) for i, cell in enumerate(row)]
+            row_height = max([base_row_h] + [len(lines) * base_row_h for lines in wrapped_cells])
+            plan.append((wrapped_cells, row_height))
 
+        for wrapped_cells, row_height in plan:
             if (y_cursor - row_height) < min_content_y:
                 next_top = _start_cont_page()
                 y_cursor = draw_table_header(f"{title} (cont.)", next_top)
@@ -3168,23 +3388,22 @@ def _render_split_panel_pdf(
     body_y = card_y_top - card_h - 0.4 * inch
 
     labor_rows = []
+    has_labor_rows = False
     rate = float(inv.price_per_hour or 0.0)
+    hours_suffix = cfg.get("hours_suffix", "hrs")
     for li in inv.labor_items:
-        try:
-            t = float(li.labor_time_hours or 0.0)
-        except Exception:
-            t = 0.0
+        t = _to_float(li.labor_time_hours)
         line_total = t * rate
-        labor_rows.append([
-            li.labor_desc or "",
-            f"{t:g} {cfg.get('hours_suffix', 'hrs')}" if t else "",
-            _money(line_total) if line_total else ""
-        ])
+        labor_desc = li.labor_desc or ""
+        time_txt = f"{t:g} {hours_suffix}" if t else ""
+        total_txt = _money(line_total) if line_total else ""
+        if labor_desc or time_txt or total_txt:
+            has_labor_rows = True
+        labor_rows.append([labor_desc, time_txt, total_txt])
 
-    has_labor_rows = any((row[0] or row[1] or row[2]) for row in labor_rows)
     if show_labor and has_labor_rows:
         body_y = draw_table(
-            cfg["labor_title"],
+            labor_title,
             content_x,
             body_y,
             [cfg["labor_desc_label"], cfg.get("labor_time_label", "Time"), cfg.get("labor_total_label", "Line Total")],
@@ -3194,16 +3413,17 @@ def _render_split_panel_pdf(
         )
 
     parts_rows = []
-    for p in inv.parts:
-        parts_rows.append([
-            p.part_name or "",
-            _money(inv.part_price_with_markup(p.part_price or 0.0)) if (p.part_price or 0.0) else ""
-        ])
+    has_parts_rows = False
+    for p, price in zip(inv.parts, _part_prices_with_markup(inv, inv.parts)):
+        part_name = p.part_name or ""
+        price_txt = _money(price) if (p.part_price or 0.0) else ""
+        if part_name or price_txt:
+            has_parts_rows = True
+        parts_rows.append([part_name, price_txt])
 
-    has_parts_rows = any((row[0] or row[1]) for row in parts_rows)
     if show_parts and has_parts_rows:
         body_y = draw_table(
-            cfg["parts_title"],
+            parts_title,
             content_x,
             body_y - 10,
             [cfg["parts_name_label"], cfg.get("parts_price_label", "Price")],
@@ -3234,15 +3454,14 @@ def _render_split_panel_pdf(
     payment_methods_h = _payment_methods_footer_height(owner, PAGE_W - (2 * content_x)) if not is_estimate else 0.0
     page_bottom_limit = footer_y + footer_clearance + payment_methods_h
 
-    needed_text_h = 0
-    for ln in all_note_lines:
-        needed_text_h += SPACER_GAP if ln == "__SPACER__" else line_height
+    spacer_count = all_note_lines.count("__SPACER__")
+    needed_text_h = spacer_count * SPACER_GAP + (len(all_note_lines) - spacer_count) * line_height
     needed_box_h = header_title_gap + needed_text_h + bottom_padding
 
     max_box_h_this_page = notes_y_top - page_bottom_limit
     notes_box_h = min(max_box_h_this_page, needed_box_h) if show_notes else 0
 
-    remaining_lines = []
+    notes_idx = 0
     if show_notes:
         pdf.setFillColor(soft_bg)
         pdf.roundRect(content_x, notes_y_top - notes_box_h, notes_box_w, notes_box_h, 12, stroke=1, fill=1)
@@ -3268,7 +3487,7 @@ def _render_split_panel_pdf(
                 y_note -= line_height
             lines_fit += 1
 
-        remaining_lines = all_note_lines[lines_fit:]
+        notes_idx = lines_fit
 
     def footer():
         if not is_estimate:
@@ -3292,9 +3511,9 @@ def _render_split_panel_pdf(
         pdf.setFillColor(colors.HexColor("#94a3b8"))
         pdf.drawString(M, PAGE_H - 0.62 * inch, f"{display_no}  •  Generated: {generated_str}")
 
-    if show_notes and remaining_lines:
+    if show_notes and notes_idx < len(all_note_lines):
         footer()
-        while remaining_lines:
+        while notes_idx < len(all_note_lines):
             start_new_page_with_header()
 
             notes_y_top_2 = PAGE_H - (M + 0.6 * inch)
@@ -3315,7 +3534,7 @@ def _render_split_panel_pdf(
             bottom2 = notes_y_top_2 - notes_box_h_2 + bottom_padding
 
             fit2 = 0
-            for line in remaining_lines:
+            for line in islice(all_note_lines, notes_idx, None):
                 if y_note2 < bottom2:
                     break
                 if line == "__SPACER__":
@@ -3325,20 +3544,57 @@ def _render_split_panel_pdf(
                     y_note2 -= line_height
                 fit2 += 1
 
-            remaining_lines = remaining_lines[fit2:]
+            notes_idx += fit2
             footer()
     else:
         footer()
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
 
     return pdf_path
 
 
+# Subtitle shown under the document title, keyed by profession template.
+_STRIP_PROFESSION_LABELS = {
+    "auto_repair": "Auto Repair",
+    "general_service": "General Service",
+    "accountant": "Accountant",
+    "computer_repair": "Computer Repair",
+    "lawn_care": "Lawn Care",
+    "flipping_items": "Flipping Items",
+    "custom": "Custom",
+}
+
+# Strip layout geometry, computed once instead of on every render.
+_STRIP_MARGIN = 0.7 * inch
+_STRIP_HEADER_H = 1.1 * inch
+_STRIP_LOGO_MAX_W = 1.1 * inch
+_STRIP_LOGO_MAX_H = 0.45 * inch
+_STRIP_LOGO_CENTER_Y = LETTER[1] - 0.7 * inch
+_STRIP_NAME_Y = LETTER[1] - 0.38 * inch
+_STRIP_INFO_Y = LETTER[1] - 0.60 * inch
+_STRIP_TITLE_Y = LETTER[1] - 0.55 * inch
+_STRIP_SUBTITLE_Y = LETTER[1] - 0.74 * inch
+_STRIP_INFO_WRAP_W = 3.6 * inch
+_STRIP_BILL_WRAP_W = 3.2 * inch
+_STRIP_SECTION_GAP = 0.35 * inch
+_STRIP_BAND_H = 0.55 * inch
+_STRIP_TABLE_MIN_Y = 1.0 * inch
+_STRIP_NOTES_FLOOR = 2.0 * inch + _STRIP_MARGIN
+_STRIP_NOTES_MIN_W = 2.2 * inch
+_STRIP_NOTES_H = 1.35 * inch
+_STRIP_SUMMARY_W = 2.5 * inch
+_STRIP_SUMMARY_MIN_H = 1.2 * inch
+_STRIP_SUMMARY_BASE_H = 0.48 * inch
+_STRIP_SUMMARY_ROW_H = 0.22 * inch
+_STRIP_SUMMARY_BOTTOM = 0.4 * inch
+_STRIP_FOOTER_Y = 0.55 * inch
+
+
 def _render_strip_pdf(
     *,
     session,
@@ -3355,15 +3611,16 @@ def _render_strip_pdf(
     doc_label: str,
     generated_dt: datetime,
     generated_str: str,
-    owner_logo_abs: str,
-    owner_logo_blob: bytes | None,
+    owner_logo: tuple[ImageReader, int, int] | None,
     is_estimate: bool,
     builder_cfg: dict | None = None,
+    out_stream=None,
+    commit: bool = True,
 ):
     PAGE_W, PAGE_H = LETTER
-    M = 0.7 * inch
+    M = _STRIP_MARGIN
 
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = _StateTrackingCanvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"{doc_label.title()} - {display_no}")
     builder_enabled = bool(builder_cfg.get("enabled", False)) if isinstance(builder_cfg, dict) else False
     builder_accent = colors.HexColor(
@@ -3386,8 +3643,8 @@ def _render_strip_pdf(
     def right_text(x, y, text, font="Helvetica", size=10, color=colors.black):
         pdf.setFont(font, size)
         pdf.setFillColor(color)
-        w = pdf.stringWidth(str(text), font, size)
-        pdf.drawString(x - w, y, str(text))
+        s = str(text)
+        pdf.drawString(x - _string_width(s, font, size), y, s)
 
     def label_value(x, y, label, value, label_font=("Helvetica-Bold", 9), value_font=("Helvetica", 10)):
         pdf.setFont(*label_font)
@@ -3402,14 +3659,19 @@ def _render_strip_pdf(
         pdf.drawString(x_left, y, label)
         right_text(x_right, y, str(value), value_font[0], value_font[1], colors.black)
 
-    show_job = bool(cfg.get("show_job", True))
-    show_labor = bool(cfg.get("show_labor", True))
-    show_parts = bool(cfg.get("show_parts", True))
-    show_shop_supplies = bool(cfg.get("show_shop_supplies", True))
-    show_notes = bool(cfg.get("show_notes", True))
+    show_job, show_labor, show_parts, show_shop_supplies, show_notes = (
+        bool(cfg.get(k, True)) for k in ("show_job", "show_labor", "show_parts", "show_shop_supplies", "show_notes")
+    )
+    labor_title = cfg["labor_title"]
+    parts_title = cfg["parts_title"]
+    hours_suffix = cfg.get("hours_suffix", "hrs")
+    # Bulk runs can trade the rounded box corners for plain rectangles.
+    fast_mode = bool(cfg.get("fast_mode", False))
+    labor_items = list(inv.labor_items)
+    parts = list(inv.parts)
 
     # Header
-    header_h = 1.1 * inch
+    header_h = _STRIP_HEADER_H
     header_bg = colors.white
     header_text = colors.black
     header_muted = muted
@@ -3424,71 +3686,35 @@ def _render_strip_pdf(
     pdf.line(M, PAGE_H - header_h - 6, PAGE_W - M, PAGE_H - header_h - 6)
 
     # Logo / business name left
-    logo_w = 0
-    if owner_logo_blob:
-        try:
-            img = ImageReader(io.BytesIO(owner_logo_blob))
-            iw, ih = img.getSize()
-            max_h = 0.45 * inch
-            max_w = 1.1 * inch
-            scale = min(max_w / iw, max_h / ih)
-            w = iw * scale
-            h = ih * scale
-            pdf.drawImage(img, M, PAGE_H - 0.7 * inch - (h / 2), width=w, height=h, mask="auto")
-            logo_w = w + 10
-        except Exception:
-            logo_w = 0
-    elif owner_logo_abs and os.path.exists(owner_logo_abs):
-        try:
-            img = ImageReader(owner_logo_abs)
-            iw, ih = img.getSize()
-            max_h = 0.45 * inch
-            max_w = 1.1 * inch
-            scale = min(max_w / float(iw), max_h / float(ih))
-            w = float(iw) * scale
-            h = float(ih) * scale
-            pdf.drawImage(img, M, PAGE_H - 0.7 * inch - (h / 2), width=w, height=h, mask="auto")
-            logo_w = w + 10
-        except Exception:
-            logo_w = 0
+    logo_w = _draw_logo(pdf, owner_logo, M, _STRIP_LOGO_CENTER_Y, _STRIP_LOGO_MAX_W, _STRIP_LOGO_MAX_H)
+    if logo_w:
+        logo_w += 10
 
     header_name = _business_header_name(owner) or "InvoiceRunner"
     pdf.setFont("Helvetica-Bold", 12)
     pdf.setFillColor(header_text)
-    pdf.drawString(M + logo_w, PAGE_H - 0.38 * inch, header_name)
+    pdf.drawString(M + logo_w, _STRIP_NAME_Y, header_name)
 
     pdf.setFont("Helvetica", 9)
     pdf.setFillColor(header_muted)
     header_info_lines = _business_header_info_lines(owner)
     info_lines = []
     for ln in header_info_lines:
-        info_lines.extend(_wrap_text(ln, "Helvetica", 9, 3.6 * inch))
-    info_y = PAGE_H - 0.60 * inch
-    for ln in info_lines[:4]:
-        pdf.drawString(M + logo_w, info_y, ln)
-        info_y -= 12
+        info_lines.extend(_wrap_text(ln, "Helvetica", 9, _STRIP_INFO_WRAP_W))
+    _draw_text_lines(pdf, M + logo_w, _STRIP_INFO_Y, info_lines[:4], 12)
 
     # Invoice label right
     right_x = PAGE_W - M
-    right_text(right_x, PAGE_H - 0.55 * inch, f"{doc_label.title()} {display_no}", "Helvetica-Bold", 12, header_text)
-    template_labels = {
-        "auto_repair": "Auto Repair",
-        "general_service": "General Service",
-        "accountant": "Accountant",
-        "computer_repair": "Computer Repair",
-        "lawn_care": "Lawn Care",
-        "flipping_items": "Flipping Items",
-        "custom": "Custom",
-    }
-    prof_label = (cfg.get("profession_label") or "").strip() or template_labels.get(template_key, "Service")
+    right_text(right_x, _STRIP_TITLE_Y, f"{doc_label.title()} {display_no}", "Helvetica-Bold", 12, header_text)
+    prof_label = (cfg.get("profession_label") or "").strip() or _STRIP_PROFESSION_LABELS.get(template_key, "Service")
     if template_key == "custom" and not (cfg.get("profession_label") or "").strip() and owner is not None:
         custom_name = (getattr(owner, "custom_profession_name", None) or "").strip()
         if custom_name:
             prof_label = custom_name
-    right_text(right_x, PAGE_H - 0.74 * inch, f"{prof_label} {doc_label.lower()}", "Helvetica", 9, header_muted)
+    right_text(right_x, _STRIP_SUBTITLE_Y, f"{prof_label} {doc_label.lower()}", "Helvetica", 9, header_muted)
 
     # Bill to + meta
-    top_y = PAGE_H - header_h - 0.35 * inch
+    top_y = PAGE_H - header_h - _STRIP_SECTION_GAP
     pdf.setFont("Helvetica-Bold", 9)
     pdf.setFillColor(colors.black)
     pdf.drawString(M, top_y, "BILL TO")
@@ -3502,22 +3728,14 @@ def _render_strip_pdf(
 
     pdf.setFont("Helvetica", 9)
     pdf.setFillColor(colors.black)
-    y_bill = top_y - 14
-    for ln in _wrap_text(customer_name, "Helvetica", 9, 3.2 * inch):
-        pdf.drawString(M, y_bill, ln)
-        y_bill -= 12
-
+    bill_lines = _wrap_text(customer_name, "Helvetica", 9, _STRIP_BILL_WRAP_W)
     if customer_address:
-        for ln in _wrap_text(customer_address, "Helvetica", 9, 3.2 * inch)[:3]:
-            pdf.drawString(M, y_bill, ln)
-            y_bill -= 12
-
+        bill_lines.extend(_wrap_text(customer_address, "Helvetica", 9, _STRIP_BILL_WRAP_W, max_lines=3))
     if customer_email:
-        pdf.drawString(M, y_bill, f"Email: {customer_email}")
-        y_bill -= 12
+        bill_lines.append(f"Email: {customer_email}")
     if customer_phone:
-        pdf.drawString(M, y_bill, f"Phone: {customer_phone}")
-        y_bill -= 12
+        bill_lines.append(f"Phone: {customer_phone}")
+    _draw_text_lines(pdf, M, top_y - 14, bill_lines, 12)
 
     # Meta block on right
     meta_x = PAGE_W - M - 180
@@ -3533,32 +3751,38 @@ def _render_strip_pdf(
 
     # Summary strip
     strip_y = top_y - 70
-    strip_h = 0.55 * inch
+    strip_h = _STRIP_BAND_H
     strip_x = M
     strip_w = PAGE_W - 2 * M
+    strip_bot = strip_y - strip_h
+    label_y = strip_y - 16
+    value_y = strip_y - 34
     pdf.setFillColor(accent)
-    pdf.rect(strip_x, strip_y - strip_h, strip_w, strip_h, stroke=0, fill=1)
+    pdf.rect(strip_x, strip_bot, strip_w, strip_h, stroke=0, fill=1)
 
     box_w = strip_w / 4
+    box0_x = strip_x + 10
+    box1_x = box0_x + box_w
+    total_box_x = strip_x + (2 * box_w)
     pdf.setFillColor(colors.white)
     pdf.setFont("Helvetica-Bold", 9)
-    pdf.drawString(strip_x + 10, strip_y - 16, "Invoice No.")
+    pdf.drawString(box0_x, label_y, "Invoice No.")
     pdf.setFont("Helvetica-Bold", 12)
-    pdf.drawString(strip_x + 10, strip_y - 34, display_no)
+    pdf.drawString(box0_x, value_y, display_no)
 
     pdf.setFont("Helvetica-Bold", 9)
-    pdf.drawString(strip_x + box_w + 10, strip_y - 16, "Issue date")
+    pdf.drawString(box1_x, label_y, "Issue date")
     pdf.setFont("Helvetica-Bold", 12)
-    pdf.drawString(strip_x + box_w + 10, strip_y - 34, inv.date_in)
+    pdf.drawString(box1_x, value_y, inv.date_in)
 
     total_price, price_owed, late_fee_amount = _invoice_pdf_amounts(inv, owner, is_estimate=is_estimate)
     pdf.setFillColor(accent_dark)
-    pdf.rect(strip_x + (2 * box_w), strip_y - strip_h, box_w * 2, strip_h, stroke=0, fill=1)
+    pdf.rect(total_box_x, strip_bot, box_w * 2, strip_h, stroke=0, fill=1)
     pdf.setFillColor(colors.white)
     pdf.setFont("Helvetica-Bold", 9)
-    pdf.drawString(strip_x + (2 * box_w) + 10, strip_y - 16, "Total due")
+    pdf.drawString(total_box_x + 10, label_y, "Total due")
     pdf.setFont("Helvetica-Bold", 14)
-    pdf.drawString(strip_x + (2 * box_w) + 10, strip_y - 36, _money(total_price))
+    pdf.drawString(total_box_x + 10, strip_y - 36, _money(total_price))
 
     # Table
     def _start_cont_page():
@@ -3576,7 +3800,7 @@ def _render_strip_pdf(
         money_cols = set(money_cols or [])
         base_row_h = 14 if builder_compact_mode else 16
         title_gap = 18
-        min_content_y = 1.0 * inch
+        min_content_y = _STRIP_TABLE_MIN_Y
 
         def draw_table_header(header_title: str, y_top_local: float):
             pdf.setFont("Helvetica-Bold", 11)
@@ -3604,15 +3828,14 @@ def _render_strip_pdf(
         y_cursor = draw_table_header(title, y_top)
         pdf.setFont("Helvetica", 10)
 
+        # Wrap every row up front so the drawing loop below only lays out text.
+        plan = []
         for row in rows:
-            wrapped_cells = []
-            row_height = base_row_h
-            for i, cell in enumerate(row):
-                max_w = col_widths[i] - 12
-                lines = _wrap_text(cell, "Helvetica", 10, max_w)
-                wrapped_cells.append(lines)
-                row_height = max(row_height, len(lines) * base_row_h)
+            wrapped_cells = [_wrap_text(cell, "Helvetica", 10, col_widths[i] - 12) for i, cell in enumerate(row)]
+            row_height = max([base_row_h] + [len(lines) * base_row_h for lines in wrapped_cells])
+            plan.append((wrapped_cells, row_height))
 
+        for wrapped_cells, row_height in plan:
             if (y_cursor - row_height) < min_content_y:
                 next_top = _start_cont_page()
                 y_cursor = draw_table_header(f"{title} (cont.)", next_top)
@@ -3621,13 +3844,13 @@ def _render_strip_pdf(
 
             cx = x
             for i, lines in enumerate(wrapped_cells):
-                line_y = y_cursor
-                for line in lines:
-                    if i in money_cols:
+                if i in money_cols:
+                    line_y = y_cursor
+                    for line in lines:
                         right_text(cx + col_widths[i] - 6, line_y, line, "Helvetica", 10)
-                    else:
-                        pdf.drawString(cx + 6, line_y, line)
-                    line_y -= base_row_h
+                        line_y -= base_row_h
+                else:
+                    _draw_text_lines(pdf, cx + 6, y_cursor, lines, base_row_h)
                 cx += col_widths[i]
 
             pdf.setStrokeColor(line_color)
@@ -3637,26 +3860,24 @@ def _render_strip_pdf(
         pdf.setStrokeColor(colors.black)
         return y_cursor - 6
 
-    body_y = strip_y - strip_h - 0.35 * inch
+    body_y = strip_bot - _STRIP_SECTION_GAP
 
     labor_rows = []
+    has_labor_rows = False
     rate = float(inv.price_per_hour or 0.0)
-    for li in inv.labor_items:
-        try:
-            t = float(li.labor_time_hours or 0.0)
-        except Exception:
-            t = 0.0
+    for li in labor_items:
+        t = _to_float(li.labor_time_hours)
         line_total = t * rate
-        labor_rows.append([
-            li.labor_desc or "",
-            f"{t:g} {cfg.get('hours_suffix', 'hrs')}" if t else "",
-            _money(line_total) if line_total else ""
-        ])
+        labor_desc = li.labor_desc or ""
+        time_txt = f"{t:g} {hours_suffix}" if t else ""
+        total_txt = _money(line_total) if line_total else ""
+        if labor_desc or time_txt or total_txt:
+            has_labor_rows = True
+        labor_rows.append([labor_desc, time_txt, total_txt])
 
-    has_labor_rows = any((row[0] or row[1] or row[2]) for row in labor_rows)
     if show_labor and has_labor_rows:
         body_y = draw_table(
-            cfg["labor_title"],
+            labor_title,
             M,
             body_y,
             [cfg["labor_desc_label"], cfg.get("labor_time_label", "Time"), cfg.get("labor_total_label", "Line Total")],
@@ -3666,16 +3887,17 @@ def _render_strip_pdf(
         )
 
     parts_rows = []
-    for p in inv.parts:
-        parts_rows.append([
-            p.part_name or "",
-            _money(inv.part_price_with_markup(p.part_price or 0.0)) if (p.part_price or 0.0) else ""
-        ])
+    has_parts_rows = False
+    for p, price in zip(parts, _part_prices_with_markup(inv, parts)):
+        part_name = p.part_name or ""
+        price_txt = _money(price) if (p.part_price or 0.0) else ""
+        if part_name or price_txt:
+            has_parts_rows = True
+        parts_rows.append([part_name, price_txt])
 
-    has_parts_rows = any((row[0] or row[1]) for row in parts_rows)
     if show_parts and has_parts_rows:
         body_y = draw_table(
-            cfg["parts_title"],
+            parts_title,
             M,
             body_y - 10,
             [cfg["parts_name_label"], cfg.get("parts_price_label", "Price")],
@@ -3685,31 +3907,31 @@ def _render_strip_pdf(
         )
 
     # Optional notes block (left side, below tables)
-    notes_floor = 2.0 * inch + M
+    notes_floor = _STRIP_NOTES_FLOOR
     if (body_y - 8) < notes_floor:
         body_y = _start_cont_page()
     if show_notes and (inv.notes or "").strip():
         notes_x = M
-        notes_w = max(2.2 * inch, PAGE_W - (3 * M) - 2.5 * inch)
+        notes_w = max(_STRIP_NOTES_MIN_W, PAGE_W - (3 * M) - _STRIP_SUMMARY_W)
         notes_y_top = max(body_y - 8, notes_floor)
-        notes_h = 1.35 * inch
+        notes_h = _STRIP_NOTES_H
         pdf.setStrokeColor(line_color)
-        pdf.roundRect(notes_x, notes_y_top - notes_h, notes_w, notes_h, 8, stroke=1, fill=0)
+        if fast_mode:
+            pdf.rect(notes_x, notes_y_top - notes_h, notes_w, notes_h, stroke=1, fill=0)
+        else:
+            pdf.roundRect(notes_x, notes_y_top - notes_h, notes_w, notes_h, 8, stroke=1, fill=0)
         pdf.setFont("Helvetica-Bold", 10)
         pdf.setFillColor(colors.black)
         pdf.drawString(notes_x + 10, notes_y_top - 16, "Notes")
         pdf.setFont("Helvetica", 9)
-        y_notes = notes_y_top - 32
-        for ln in _wrap_text(inv.notes or "", "Helvetica", 9, notes_w - 20)[:5]:
-            pdf.drawString(notes_x + 10, y_notes, ln)
-            y_notes -= 12
+        _draw_text_lines(pdf, notes_x + 10, notes_y_top - 32, _wrap_text(inv.notes or "", "Helvetica", 9, notes_w - 20, max_lines=5), 12)
 
     # Summary block at bottom right
     total_parts = inv.parts_total() if show_parts else 0.0
     total_labor = inv.labor_total() if show_labor else 0.0
     tax_amount = inv.tax_amount()
 
-    sum_w = 2.5 * inch
+    sum_w = _STRIP_SUMMARY_W
     sum_x = PAGE_W - M - sum_w
     row_count = 1  # total
     if show_labor and has_labor_rows and total_labor:
@@ -3731,57 +3953,61 @@ def _render_strip_pdf(
         row_count += 1  # paid
     if not is_estimate:
         row_count += 1  # amount due
-    sum_h = max(1.2 * inch, (0.48 * inch + (row_count * 0.22 * inch)))
-    sum_y = max(body_y - 12, (sum_h + 0.4 * inch))
+    sum_h = max(_STRIP_SUMMARY_MIN_H, (_STRIP_SUMMARY_BASE_H + (row_count * _STRIP_SUMMARY_ROW_H)))
+    sum_y = max(body_y - 12, (sum_h + _STRIP_SUMMARY_BOTTOM))
     pdf.setStrokeColor(line_color)
-    pdf.roundRect(sum_x, sum_y - sum_h, sum_w, sum_h, 8, stroke=1, fill=0)
+    if fast_mode:
+        pdf.rect(sum_x, sum_y - sum_h, sum_w, sum_h, stroke=1, fill=0)
+    else:
+        pdf.roundRect(sum_x, sum_y - sum_h, sum_w, sum_h, 8, stroke=1, fill=0)
+    left_edge = sum_x + 10
+    right_edge = sum_x + sum_w - 10
     pdf.setFont("Helvetica-Bold", 10)
-    pdf.drawString(sum_x + 10, sum_y - 16, "Summary")
+    pdf.drawString(left_edge, sum_y - 16, "Summary")
 
     y = sum_y - 36
-    right_edge = sum_x + sum_w - 10
     if show_labor and has_labor_rows and total_labor:
-        label_right_value(sum_x + 10, right_edge, y, f"{cfg['labor_title']}:", _money(total_labor)); y -= 14
+        label_right_value(left_edge, right_edge, y, f"{labor_title}:", _money(total_labor)); y -= 14
     if show_parts and has_parts_rows and total_parts:
-        label_right_value(sum_x + 10, right_edge, y, f"{cfg['parts_title']}:", _money(total_parts)); y -= 14
+        label_right_value(left_edge, right_edge, y, f"{parts_title}:", _money(total_parts)); y -= 14
     if show_shop_supplies and inv.shop_supplies:
-        label_right_value(sum_x + 10, right_edge, y, f"{cfg['shop_supplies_label']}:", _money(inv.shop_supplies)); y -= 14
+        label_right_value(left_edge, right_edge, y, f"{cfg['shop_supplies_label']}:", _money(inv.shop_supplies)); y -= 14
     if tax_amount:
-        label_right_value(sum_x + 10, right_edge, y, f"{_tax_label(inv)}:", _money(tax_amount)); y -= 14
+        label_right_value(left_edge, right_edge, y, f"{_tax_label(inv)}:", _money(tax_amount)); y -= 14
     if late_fee_amount > 0 and not is_estimate:
-        label_right_value(sum_x + 10, right_edge, y, "Late Fee:", _money(late_fee_amount)); y -= 14
+        label_right_value(left_edge, right_edge, y, "Late Fee:", _money(late_fee_amount)); y -= 14
 
     pdf.setStrokeColor(line_color)
-    pdf.line(sum_x + 10, y + 4, sum_x + sum_w - 10, y + 4)
+    pdf.line(left_edge, y + 4, right_edge, y + 4)
     pdf.setStrokeColor(colors.black)
     y -= 8
     label = "Estimated Total:" if is_estimate else "Total:"
-    label_right_value(sum_x + 10, right_edge, y, label, _money(total_price)); y -= 16
+    label_right_value(left_edge, right_edge, y, label, _money(total_price)); y -= 16
     if not is_estimate and paid_amount:
         if paid_processing_fee > 0:
-            label_right_value(sum_x + 10, right_edge, y, "Processing Fee:", _money(paid_processing_fee)); y -= 14
+            label_right_value(left_edge, right_edge, y, "Processing Fee:", _money(paid_processing_fee)); y -= 14
         if paid_tip > 0:
-            label_right_value(sum_x + 10, right_edge, y, "Tip:", _money(paid_tip)); y -= 14
-        label_right_value(sum_x + 10, right_edge, y, "Paid:", _money(paid_amount)); y -= 16
+            label_right_value(left_edge, right_edge, y, "Tip:", _money(paid_tip)); y -= 14
+        label_right_value(left_edge, right_edge, y, "Paid:", _money(paid_amount)); y -= 16
     if not is_estimate:
-        label_right_value(sum_x + 10, right_edge, y, "Amount Due:", _money(price_owed))
+        label_right_value(left_edge, right_edge, y, "Amount Due:", _money(price_owed))
 
     # Footer
     if not is_estimate:
-        _draw_payment_methods_footer(pdf, owner, M, 0.55 * inch, PAGE_W - (2 * M))
+        _draw_payment_methods_footer(pdf, owner, M, _STRIP_FOOTER_Y, PAGE_W - (2 * M))
     pdf.setFont("Helvetica-Oblique", 9)
     pdf.setFillColor(muted)
     if is_estimate:
-        pdf.drawString(M, 0.55 * inch, "Total is an estimated cost of service. Actual amount may differ.")
+        pdf.drawString(M, _STRIP_FOOTER_Y, "Total is an estimated cost of service. Actual amount may differ.")
     else:
-        pdf.drawRightString(PAGE_W - M, 0.55 * inch, "Thank you for your business.")
+        pdf.drawRightString(PAGE_W - M, _STRIP_FOOTER_Y, "Thank you for your business.")
     pdf.setFillColor(colors.black)
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
 
     return pdf_path
 
@@ -3802,10 +4028,12 @@ def _render_basic_pdf(
     generated_dt: datetime,
     generated_str: str,
     is_estimate: bool,
+    out_stream=None,
+    commit: bool = True,
 ):
     PAGE_W, PAGE_H = LETTER
     M = 0.5 * inch
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = _StateTrackingCanvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"{doc_label.title()} - {display_no}")
     total_with_fees, due_with_fees, late_fee_amount = _invoice_pdf_amounts(inv, owner, is_estimate=is_estimate)
 
@@ -3813,9 +4041,7 @@ def _render_basic_pdf(
         pdf.setFont(font, size)
         pdf.drawRightString(x, y, str(text or ""))
 
-    header_name = ((_business_header_name(owner) or "").strip()) if owner else ""
     header_lines = [ln for ln in _business_header_info_lines(owner) if ln]
-    header_phone = _format_phone((getattr(owner, "phone", None) or "").strip()) if owner else ""
 
     left_x = M
     top_y = PAGE_H - M
@@ -3830,6 +4056,7 @@ def _render_basic_pdf(
         pdf.drawString(left_x, line_y, ln)
         line_y -= 12
     if not header_lines and _show_business_phone(owner):
+        header_phone = _format_phone((getattr(owner, "phone", None) or "").strip()) if owner else ""
         pdf.drawString(left_x, line_y, f"Phone: {header_phone or '(000) 000-0000'}")
 
     pdf.setFont("Helvetica-Bold", 30)
@@ -3869,7 +4096,7 @@ def _render_basic_pdf(
     pdf.setFont("Helvetica", 9)
     pdf.drawString(left_x + 2, bill_text_y, (inv.name or "").strip() or "[Name]")
     bill_text_y -= 12
-    for line in (_wrap_text(customer_address or "", "Helvetica", 9, 2.6 * inch)[:2] or ["[Street Address]", "[City, ST ZIP]"]):
+    for line in (_wrap_text(customer_address or "", "Helvetica", 9, 2.6 * inch, max_lines=2) or ["[Street Address]", "[City, ST ZIP]"]):
         pdf.drawString(left_x + 2, bill_text_y, line)
         bill_text_y -= 11
     pdf.drawString(left_x + 2, bill_text_y, f"Phone: {customer_phone or '[Phone]'}")
@@ -3894,16 +4121,14 @@ def _render_basic_pdf(
 
     items: list[tuple[str, float]] = []
     rate = float(inv.price_per_hour or 0.0)
+    rate_txt = _money(rate)
     for li in inv.labor_items:
-        try:
-            t = float(li.labor_time_hours or 0.0)
-        except Exception:
-            t = 0.0
+        t = _to_float(li.labor_time_hours)
         if t <= 0:
             continue
-        items.append((f"{cfg.get('labor_title', 'Labor')}: {li.labor_desc or 'Service'} ({t:g} hr @ {_money(rate)}/hr)", t * rate))
-    for p in inv.parts:
-        price = float(inv.part_price_with_markup(p.part_price or 0.0) or 0.0)
+        items.append((f"{cfg.get('labor_title', 'Labor')}: {li.labor_desc or 'Service'} ({t:g} hr @ {rate_txt}/hr)", t * rate))
+    parts = list(inv.parts)
+    for p, price in zip(parts, _part_prices_with_markup(inv, parts)):
         if price > 0:
             items.append((p.part_name or "Part", price))
     if show_shop := bool(cfg.get("show_shop_supplies", True)):
@@ -3924,8 +4149,12 @@ def _render_basic_pdf(
     row_y = table_top - header_h - 14
     line_h = 12
     max_desc_w = desc_w - 10
+    max_unwrapped_len = max_desc_w / (9 * _HELVETICA_MAX_ADVANCE)
     for desc, amount in items:
-        wrapped = _wrap_text(desc, "Helvetica", 9, max_desc_w)[:3] or [desc]
+        if len(desc) <= max_unwrapped_len and desc.isascii():
+            wrapped = [" ".join(desc.split())]
+        else:
+            wrapped = _wrap_text(desc, "Helvetica", 9, max_desc_w, max_lines=3) or [desc]
         needed = line_h * len(wrapped)
         if row_y - needed < (table_top - table_h + 26):
             break
@@ -3950,17 +4179,17 @@ def _render_basic_pdf(
     notes_text = (inv.notes or "").strip()
     if notes_text:
         pdf.setFont("Helvetica", 8)
-        wrapped_notes = _wrap_text(notes_text, "Helvetica", 8, PAGE_W - (2 * M) - 40)[:3]
+        wrapped_notes = _wrap_text(notes_text, "Helvetica", 8, PAGE_W - (2 * M) - 40, max_lines=3)
         note_y = foot_y + 14 + (_payment_methods_footer_height(owner, PAGE_W - (2 * M)) if not is_estimate else 0.0)
         for line in wrapped_notes:
             pdf.drawCentredString(PAGE_W / 2.0, note_y, line)
             note_y -= 12
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
     return pdf_path
 
 
@@ -3979,9 +4208,10 @@ def _render_simple_pdf(
     doc_label: str,
     generated_dt: datetime,
     generated_str: str,
-    owner_logo_abs: str,
-    owner_logo_blob: bytes | None,
+    owner_logo: tuple[ImageReader, int, int] | None,
     is_estimate: bool,
+    out_stream=None,
+    commit: bool = True,
 ):
     PAGE_W, PAGE_H = LETTER
     M = 0.65 * inch
@@ -3989,7 +4219,7 @@ def _render_simple_pdf(
     text_dark = colors.HexColor("#1f2937")
     muted = colors.HexColor("#6b7280")
 
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = _StateTrackingCanvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"{doc_label.title()} - {display_no}")
     total_with_fees, due_with_fees, late_fee_amount = _invoice_pdf_amounts(inv, owner, is_estimate=is_estimate)
 
@@ -3998,9 +4228,7 @@ def _render_simple_pdf(
         pdf.setFillColor(color)
         pdf.drawRightString(x, y, str(text or ""))
 
-    header_name = ((_business_header_name(owner) or "").strip()) if owner else ""
     addr_lines = [ln for ln in _business_header_info_lines(owner) if ln]
-    phone_txt = _format_phone((getattr(owner, "phone", None) or "").strip()) if owner else ""
 
     top_y = PAGE_H - M
     icon_w = 1.24 * inch
@@ -4014,17 +4242,9 @@ def _render_simple_pdf(
     logo_y = icon_cy - 0.34 * inch
     logo_w = 0.68 * inch
     logo_h = 0.68 * inch
-    if owner_logo_blob:
+    if owner_logo is not None:
         try:
-            img = ImageReader(io.BytesIO(owner_logo_blob))
-            pdf.drawImage(img, logo_x, logo_y, width=logo_w, height=logo_h, mask="auto")
-            logo_drawn = True
-        except Exception:
-            logo_drawn = False
-    elif owner_logo_abs and os.path.exists(owner_logo_abs):
-        try:
-            img = ImageReader(owner_logo_abs)
-            pdf.drawImage(img, logo_x, logo_y, width=logo_w, height=logo_h, mask="auto")
+            pdf.drawImage(owner_logo[0], logo_x, logo_y, width=logo_w, height=logo_h, mask="auto")
             logo_drawn = True
         except Exception:
             logo_drawn = False
@@ -4044,6 +4264,7 @@ def _render_simple_pdf(
         right_text(comp_x, y, ln, "Helvetica", 11, text_dark)
         y -= 16
     if not addr_lines and _show_business_phone(owner):
+        phone_txt = _format_phone((getattr(owner, "phone", None) or "").strip()) if owner else ""
         right_text(comp_x, y, phone_txt or "1-888-123-4567", "Helvetica", 11, text_dark)
 
     bill_x = M
@@ -4056,7 +4277,7 @@ def _render_simple_pdf(
     pdf.drawString(bill_x, bill_y - 18, (inv.name or getattr(customer, "name", None) or "Your Client"))
     pdf.setFont("Helvetica", 11)
     y = bill_y - 36
-    for ln in _wrap_text(customer_address or "1234 Clients Street\nCity, ST 90210", "Helvetica", 11, 2.8 * inch)[:3]:
+    for ln in _wrap_text(customer_address or "1234 Clients Street\nCity, ST 90210", "Helvetica", 11, 2.8 * inch, max_lines=3):
         pdf.drawString(bill_x, y, ln)
         y -= 15
     pdf.drawString(bill_x, y, customer_phone or "1-888-123-8910")
@@ -4142,15 +4363,16 @@ def _render_simple_pdf(
     rows: list[tuple[str, str, str, float, str]] = []
     rate = float(inv.price_per_hour or 0.0)
     if bool(cfg.get("show_labor", True)):
+        rate_txt = _money(rate)
         for li in inv.labor_items:
-            hrs = float(li.labor_time_hours or 0.0)
+            hrs = _to_float(li.labor_time_hours)
             if hrs <= 0:
                 continue
             amt = hrs * rate
-            rows.append(((li.labor_desc or "Service"), _money(rate), f"{hrs:g}", amt, cfg.get("labor_title", "Labor")))
+            rows.append(((li.labor_desc or "Service"), rate_txt, f"{hrs:g}", amt, cfg.get("labor_title", "Labor")))
     if bool(cfg.get("show_parts", True)):
-        for p in inv.parts:
-            unit = float(inv.part_price_with_markup(p.part_price or 0.0) or 0.0)
+        parts = list(inv.parts)
+        for p, unit in zip(parts, _part_prices_with_markup(inv, parts)):
             rows.append(((p.part_name or "Part"), _money(unit), "1", unit, cfg.get("parts_title", "Parts")))
     if bool(cfg.get("show_shop_supplies", True)) and float(inv.shop_supplies or 0.0):
         amt = float(inv.shop_supplies or 0.0)
@@ -4158,7 +4380,7 @@ def _render_simple_pdf(
 
     pdf.setFont("Helvetica", 11)
     for desc, rate_txt, qty_txt, amount_num, subdesc in rows:
-        wrapped = _wrap_text(desc, "Helvetica", 11, col_desc - 8)[:2] or [desc]
+        wrapped = _wrap_text(desc, "Helvetica", 11, col_desc - 8, max_lines=2) or [desc]
         needed = 18 + (len(wrapped) * 14)
         if row_y - needed < min_y:
             row_y = next_page()
@@ -4191,39 +4413,40 @@ def _render_simple_pdf(
 
     sum_right = PAGE_W - M
     sum_left = sum_right - 2.85 * inch
+    sum_label_x = sum_left + 1.35 * inch
     sy = max(row_y, 1.8 * inch)
     pdf.setStrokeColor(colors.HexColor("#d1d5db"))
     pdf.line(sum_left, sy + 8, sum_right, sy + 8)
     pdf.setFillColor(text_dark)
     pdf.setFont("Helvetica", 12)
     sum_y = sy - 10
-    right_text(sum_left + 1.35 * inch, sum_y, "Subtotal", "Helvetica", 12, text_dark)
+    right_text(sum_label_x, sum_y, "Subtotal", "Helvetica", 12, text_dark)
     right_text(sum_right, sum_y, _money(subtotal), "Helvetica", 12, text_dark)
     if tax > 0:
         sum_y -= 20
-        right_text(sum_left + 1.35 * inch, sum_y, _tax_label(inv), "Helvetica", 12, text_dark)
+        right_text(sum_label_x, sum_y, _tax_label(inv), "Helvetica", 12, text_dark)
         right_text(sum_right, sum_y, _money(tax), "Helvetica", 12, text_dark)
     if late_fee_amount > 0 and not is_estimate:
         sum_y -= 20
-        right_text(sum_left + 1.35 * inch, sum_y, "Late Fee", "Helvetica", 12, text_dark)
+        right_text(sum_label_x, sum_y, "Late Fee", "Helvetica", 12, text_dark)
         right_text(sum_right, sum_y, _money(late_fee_amount), "Helvetica", 12, text_dark)
     pdf.setStrokeColor(colors.HexColor("#d1d5db"))
     divider_y = sum_y - 12
     pdf.line(sum_left, divider_y, sum_right, divider_y)
     total_y = divider_y - 20
-    right_text(sum_left + 1.35 * inch, total_y, "Total", "Helvetica-Bold", 13, text_dark)
+    right_text(sum_label_x, total_y, "Total", "Helvetica-Bold", 13, text_dark)
     right_text(sum_right, total_y, _money(total), "Helvetica-Bold", 13, text_dark)
     if not is_estimate and paid:
         paid_y = total_y - 20
         if paid_processing_fee > 0:
-            right_text(sum_left + 1.35 * inch, paid_y, "Processing Fee", "Helvetica", 12, text_dark)
+            right_text(sum_label_x, paid_y, "Processing Fee", "Helvetica", 12, text_dark)
             right_text(sum_right, paid_y, _money(paid_processing_fee), "Helvetica", 12, text_dark)
             paid_y -= 20
         if paid_tip > 0:
-            right_text(sum_left + 1.35 * inch, paid_y, "Tip", "Helvetica", 12, text_dark)
+            right_text(sum_label_x, paid_y, "Tip", "Helvetica", 12, text_dark)
             right_text(sum_right, paid_y, _money(paid_tip), "Helvetica", 12, text_dark)
             paid_y -= 20
-        right_text(sum_left + 1.35 * inch, paid_y, "Paid", "Helvetica", 12, text_dark)
+        right_text(sum_label_x, paid_y, "Paid", "Helvetica", 12, text_dark)
         right_text(sum_right, paid_y, _money(paid), "Helvetica", 12, text_dark)
         pdf.setStrokeColor(accent)
         pdf.setLineWidth(2)
@@ -4231,11 +4454,11 @@ def _render_simple_pdf(
         pdf.line(sum_left, paid_divider_y, sum_right, paid_divider_y)
         pdf.setLineWidth(1)
         due_y = paid_divider_y - 20
-        right_text(sum_left + 1.35 * inch, due_y, "Amount Due", "Helvetica-Bold", 13, text_dark)
+        right_text(sum_label_x, due_y, "Amount Due", "Helvetica-Bold", 13, text_dark)
         right_text(sum_right, due_y, _money(amount_due), "Helvetica-Bold", 13, text_dark)
     elif not is_estimate:
         due_y = total_y - 20
-        right_text(sum_left + 1.35 * inch, due_y, "Amount Due", "Helvetica-Bold", 13, text_dark)
+        right_text(sum_label_x, due_y, "Amount Due", "Helvetica-Bold", 13, text_dark)
         right_text(sum_right, due_y, _money(amount_due), "Helvetica-Bold", 13, text_dark)
 
     notes_y = M + 0.95 * inch
@@ -4244,7 +4467,7 @@ def _render_simple_pdf(
     pdf.drawString(M, notes_y, "Notes")
     pdf.setFillColor(text_dark)
     pdf.setFont("Helvetica", 11)
-    note_lines = _wrap_text((inv.notes or "Thank you for your business!"), "Helvetica", 11, 4.6 * inch)[:3]
+    note_lines = _wrap_text((inv.notes or "Thank you for your business!"), "Helvetica", 11, 4.6 * inch, max_lines=3)
     n_y = notes_y - 18
     for ln in note_lines:
         pdf.drawString(M, n_y, ln)
@@ -4259,15 +4482,15 @@ def _render_simple_pdf(
     if not terms_text:
         due_days = int(getattr(owner, "payment_due_days", 30) or 30) if owner else 30
         terms_text = f"Please pay within {max(0, due_days)} days using the link in your invoice email."
-    pdf.drawString(M, M + 0.05 * inch, _wrap_text(terms_text, "Helvetica", 10, 5.4 * inch)[0])
+    pdf.drawString(M, M + 0.05 * inch, _wrap_text(terms_text, "Helvetica", 10, 5.4 * inch, max_lines=1)[0])
     if not is_estimate:
         _draw_payment_methods_footer(pdf, owner, PAGE_W - M - (2.85 * inch), M + 0.02 * inch, 2.85 * inch)
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
     return pdf_path
 
 
@@ -4286,9 +4509,10 @@ def _render_blueprint_pdf(
     doc_label: str,
     generated_dt: datetime,
     generated_str: str,
-    owner_logo_abs: str,
-    owner_logo_blob: bytes | None,
+    owner_logo: tuple[ImageReader, int, int] | None,
     is_estimate: bool,
+    out_stream=None,
+    commit: bool = True,
 ):
     PAGE_W, PAGE_H = LETTER
     M = 0.48 * inch
@@ -4301,33 +4525,45 @@ def _render_blueprint_pdf(
     card_bg = colors.HexColor("#f8fafc")
     line = colors.HexColor("#d6dee7")
 
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = _StateTrackingCanvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"{doc_label.title()} - {display_no}")
     total_with_fees, due_with_fees, late_fee_amount = _invoice_pdf_amounts(inv, owner, is_estimate=is_estimate)
 
     right_x0 = M + rail_w + 0.28 * inch
     right_w = PAGE_W - right_x0 - M
 
+    draw_left = pdf.drawString
+    draw_right = pdf.drawRightString
+
+    def left_text(x, y, text, font="Helvetica", size=10, color=ink):
+        pdf.setFont(font, size)
+        pdf.setFillColor(color)
+        draw_left(x, y, str(text or ""))
+
     def right_text(x, y, text, font="Helvetica", size=10, color=ink):
         pdf.setFont(font, size)
         pdf.setFillColor(color)
-        pdf.drawRightString(x, y, str(text or ""))
+        draw_right(x, y, str(text or ""))
 
     def page_chrome():
-        pdf.setFillColor(colors.white)
-        pdf.rect(0, 0, PAGE_W, PAGE_H, stroke=0, fill=1)
-        pdf.setFillColor(dark)
-        pdf.rect(M, M, rail_w, PAGE_H - (2 * M), stroke=0, fill=1)
-        pdf.setFillColor(dark2)
-        pdf.rect(M, PAGE_H - M - 1.9 * inch, rail_w, 0.5 * inch, stroke=0, fill=1)
-        pdf.setFillColor(accent)
-        accent_h = 0.06 * inch
-        accent_y = M + ((PAGE_H - (2 * M)) / 2.0) - (accent_h / 2.0)
-        pdf.rect(M, accent_y, rail_w, accent_h, stroke=0, fill=1)
+        # The rail art is identical on every page: record it once as a form XObject and reuse it.
+        if not pdf.hasForm("blueprint_chrome"):
+            pdf.beginForm("blueprint_chrome")
+            pdf.setFillColor(colors.white)
+            pdf.rect(0, 0, PAGE_W, PAGE_H, stroke=0, fill=1)
+            pdf.setFillColor(dark)
+            pdf.rect(M, M, rail_w, PAGE_H - (2 * M), stroke=0, fill=1)
+            pdf.setFillColor(dark2)
+            pdf.rect(M, PAGE_H - M - 1.9 * inch, rail_w, 0.5 * inch, stroke=0, fill=1)
+            pdf.setFillColor(accent)
+            accent_h = 0.06 * inch
+            accent_y = M + ((PAGE_H - (2 * M)) / 2.0) - (accent_h / 2.0)
+            pdf.rect(M, accent_y, rail_w, accent_h, stroke=0, fill=1)
+            pdf.endForm()
+        pdf.doForm("blueprint_chrome")
 
     page_chrome()
 
-    header_name = ((_business_header_name(owner) or "").strip()) if owner else ""
     info_lines_all = _business_header_info_lines(owner)
     rail_center = M + rail_w / 2.0
 
@@ -4337,21 +4573,11 @@ def _render_blueprint_pdf(
     logo_x = M + (rail_w - logo_box_w) / 2.0
     logo_y = PAGE_H - M - 1.20 * inch
     logo_drawn = False
-    if owner_logo_blob:
-        try:
-            img = ImageReader(io.BytesIO(owner_logo_blob))
-            pdf.setFillColor(colors.white)
-            pdf.roundRect(logo_x, logo_y - logo_box_h, logo_box_w, logo_box_h, 10, stroke=0, fill=1)
-            pdf.drawImage(img, logo_x + 12, logo_y - logo_box_h + 12, width=logo_box_w - 24, height=logo_box_h - 24, preserveAspectRatio=True, mask="auto", anchor="c")
-            logo_drawn = True
-        except Exception:
-            logo_drawn = False
-    elif owner_logo_abs and os.path.exists(owner_logo_abs):
+    if owner_logo is not None:
         try:
-            img = ImageReader(owner_logo_abs)
             pdf.setFillColor(colors.white)
             pdf.roundRect(logo_x, logo_y - logo_box_h, logo_box_w, logo_box_h, 10, stroke=0, fill=1)
-            pdf.drawImage(img, logo_x + 12, logo_y - logo_box_h + 12, width=logo_box_w - 24, height=logo_box_h - 24, preserveAspectRatio=True, mask="auto", anchor="c")
+            pdf.drawImage(owner_logo[0], logo_x + 12, logo_y - logo_box_h + 12, width=logo_box_w - 24, height=logo_box_h - 24, preserveAspectRatio=True, mask="auto", anchor="c")
             logo_drawn = True
         except Exception:
             logo_drawn = False
@@ -4372,12 +4598,8 @@ def _render_blueprint_pdf(
 
     # Header cards (right side)
     top = PAGE_H - M - 0.22 * inch
-    pdf.setFillColor(ink)
-    pdf.setFont("Helvetica-Bold", 24)
-    pdf.drawString(right_x0, top - 8, doc_label)
-    pdf.setFont("Helvetica", 10)
-    pdf.setFillColor(muted)
-    pdf.drawString(right_x0, top - 24, f"Generated {generated_str}")
+    left_text(right_x0, top - 8, doc_label, "Helvetica-Bold", 24)
+    left_text(right_x0, top - 24, f"Generated {generated_str}", "Helvetica", 10, muted)
 
     card_y = top - 44
     c_h = 54
@@ -4386,23 +4608,15 @@ def _render_blueprint_pdf(
     pdf.setFillColor(card_bg)
     pdf.setStrokeColor(line)
     pdf.roundRect(right_x0, card_y - c_h, c_w, c_h, 8, stroke=1, fill=1)
-    pdf.setFillColor(muted)
-    pdf.setFont("Helvetica-Bold", 9)
-    pdf.drawString(right_x0 + 10, card_y - 14, "Document Number")
-    pdf.setFillColor(ink)
-    pdf.setFont("Helvetica-Bold", 14)
-    pdf.drawString(right_x0 + 10, card_y - 34, display_no)
+    left_text(right_x0 + 10, card_y - 14, "Document Number", "Helvetica-Bold", 9, muted)
+    left_text(right_x0 + 10, card_y - 34, display_no, "Helvetica-Bold", 14)
     # right card
     x2 = right_x0 + c_w + 18
     pdf.setFillColor(card_bg)
     pdf.setStrokeColor(line)
     pdf.roundRect(x2, card_y - c_h, c_w, c_h, 8, stroke=1, fill=1)
-    pdf.setFillColor(muted)
-    pdf.setFont("Helvetica-Bold", 9)
-    pdf.drawString(x2 + 10, card_y - 14, "Amount Due" if not is_estimate else "Estimate Total")
-    pdf.setFillColor(ink)
-    pdf.setFont("Helvetica-Bold", 14)
-    pdf.drawString(x2 + 10, card_y - 34, _money(due_with_fees if not is_estimate else total_with_fees))
+    left_text(x2 + 10, card_y - 14, "Amount Due" if not is_estimate else "Estimate Total", "Helvetica-Bold", 9, muted)
+    left_text(x2 + 10, card_y - 34, _money(due_with_fees if not is_estimate else total_with_fees), "Helvetica-Bold", 14)
 
     # Bill to + date panel
     block_top = card_y - c_h - 14
@@ -4412,15 +4626,11 @@ def _render_blueprint_pdf(
     pdf.setFillColor(colors.white)
     pdf.setStrokeColor(line)
     pdf.roundRect(right_x0, block_top - bill_h, left_w, bill_h, 8, stroke=1, fill=1)
-    pdf.setFillColor(accent)
-    pdf.setFont("Helvetica-Bold", 10)
-    pdf.drawString(right_x0 + 10, block_top - 14, "BILLED TO")
-    pdf.setFillColor(ink)
-    pdf.setFont("Helvetica-Bold", 12)
-    pdf.drawString(right_x0 + 10, block_top - 32, (inv.name or getattr(customer, "name", None) or "Customer"))
+    left_text(right_x0 + 10, block_top - 14, "BILLED TO", "Helvetica-Bold", 10, accent)
+    left_text(right_x0 + 10, block_top - 32, (inv.name or getattr(customer, "name", None) or "Customer"), "Helvetica-Bold", 12)
     pdf.setFont("Helvetica", 10)
     by = block_top - 48
-    for ln in _wrap_text(customer_address or "", "Helvetica", 10, left_w - 20)[:2]:
+    for ln in _wrap_text(customer_address or "", "Helvetica", 10, left_w - 20, max_lines=2):
         pdf.drawString(right_x0 + 10, by, ln)
         by -= 13
     if customer_phone:
@@ -4437,24 +4647,16 @@ def _render_blueprint_pdf(
     px = right_x0 + left_w + 22
     py = block_top - 16
     pdf.drawString(px, py, "Date Issued")
-    pdf.setFillColor(ink)
-    pdf.setFont("Helvetica-Bold", 11)
-    pdf.drawString(px, py - 14, generated_str)
+    left_text(px, py - 14, generated_str, "Helvetica-Bold", 11)
     py -= 36
     if not is_estimate:
         due_line = _invoice_due_date_line(inv, owner, is_estimate=is_estimate)
         if due_line:
             due_date_txt = due_line.replace("Payment due date:", "").strip()
-            pdf.setFillColor(muted)
-            pdf.setFont("Helvetica-Bold", 9)
-            pdf.drawString(px, py, "Due Date")
-            pdf.setFillColor(ink)
-            pdf.setFont("Helvetica-Bold", 11)
-            pdf.drawString(px, py - 14, due_date_txt)
+            left_text(px, py, "Due Date", "Helvetica-Bold", 9, muted)
+            left_text(px, py - 14, due_date_txt, "Helvetica-Bold", 11)
             py -= 32
-    pdf.setFillColor(muted)
-    pdf.setFont("Helvetica-Bold", 9)
-    pdf.drawString(px, py, "Status")
+    left_text(px, py, "Status", "Helvetica-Bold", 9, muted)
     pdf.setFillColor(ink)
     paid_flag = float(due_with_fees or 0.0) <= 0.0
     pdf.setFont("Helvetica-Bold", 11)
@@ -4472,16 +4674,21 @@ def _render_blueprint_pdf(
     x_qty = x_desc + col_desc
     x_rate = x_qty + col_qty
     x_amt = x_rate + col_rate
-    row_desc_header = cfg.get("labor_desc_label", "Description")
-    row_qty_header = cfg.get("labor_time_label", "Qty")
-    row_rate_header = "Rate"
-    row_amount_header = cfg.get("labor_total_label", "Amount")
-    pdf.setFillColor(colors.white)
-    pdf.setFont("Helvetica-Bold", 9)
-    pdf.drawString(x_desc + 10, table_top - 16, str(row_desc_header).upper())
-    right_text(x_qty + col_qty - 8, table_top - 16, str(row_qty_header).upper(), "Helvetica-Bold", 9, colors.white)
-    right_text(x_rate + col_rate - 8, table_top - 16, str(row_rate_header).upper(), "Helvetica-Bold", 9, colors.white)
-    right_text(x_amt + col_amt - 8, table_top - 16, str(row_amount_header).upper(), "Helvetica-Bold", 9, colors.white)
+    # Header titles are repeated on every continuation page; upper-case them once.
+    row_desc_header = str(cfg.get("labor_desc_label", "Description")).upper()
+    row_qty_header = str(cfg.get("labor_time_label", "Qty")).upper()
+    row_rate_header = "RATE"
+    row_amount_header = str(cfg.get("labor_total_label", "Amount")).upper()
+
+    def table_header_titles(y: float) -> None:
+        pdf.setFillColor(colors.white)
+        pdf.setFont("Helvetica-Bold", 9)
+        pdf.drawString(x_desc + 10, y, row_desc_header)
+        pdf.drawRightString(x_qty + col_qty - 8, y, row_qty_header)
+        pdf.drawRightString(x_rate + col_rate - 8, y, row_rate_header)
+        pdf.drawRightString(x_amt + col_amt - 8, y, row_amount_header)
+
+    table_header_titles(table_top - 16)
 
     row_y = table_top - 38
     min_y = 1.92 * inch
@@ -4490,65 +4697,88 @@ def _render_blueprint_pdf(
         pdf.showPage()
         page_chrome()
         top2 = PAGE_H - M - 0.25 * inch
-        pdf.setFillColor(ink)
-        pdf.setFont("Helvetica-Bold", 20)
-        pdf.drawString(right_x0, top2 - 8, f"{doc_label} (cont.)")
+        left_text(right_x0, top2 - 8, f"{doc_label} (cont.)", "Helvetica-Bold", 20)
         table_top2 = top2 - 34
         pdf.setFillColor(dark)
         pdf.rect(right_x0, table_top2 - 24, right_w, 24, stroke=0, fill=1)
-        pdf.setFillColor(colors.white)
-        pdf.setFont("Helvetica-Bold", 9)
-        pdf.drawString(x_desc + 10, table_top2 - 16, str(row_desc_header).upper())
-        right_text(x_qty + col_qty - 8, table_top2 - 16, str(row_qty_header).upper(), "Helvetica-Bold", 9, colors.white)
-        right_text(x_rate + col_rate - 8, table_top2 - 16, str(row_rate_header).upper(), "Helvetica-Bold", 9, colors.white)
-        right_text(x_amt + col_amt - 8, table_top2 - 16, str(row_amount_header).upper(), "Helvetica-Bold", 9, colors.white)
+        table_header_titles(table_top2 - 16)
         return table_top2 - 38
 
-    rows: list[tuple[str, str, str, float, str]] = []
+    # (description, qty, rate text, amount text, kind)
+    rows: list[tuple[str, str, str, str, str]] = []
+    parts_sum = 0.0
     if bool(cfg.get("show_labor", True)):
         rate = float(inv.price_per_hour or 0.0)
+        rate_txt = _money(rate)
+        labor_kind = cfg.get("labor_title", "Labor")
         for li in inv.labor_items:
-            hrs = float(li.labor_time_hours or 0.0)
+            hrs = _to_float(li.labor_time_hours)
             if hrs <= 0:
                 continue
-            amount = hrs * rate
-            rows.append((li.labor_desc or "Service labor", f"{hrs:g}", _money(rate), amount, cfg.get("labor_title", "Labor")))
+            rows.append((li.labor_desc or "Service labor", f"{hrs:g}", rate_txt, _money(hrs * rate), labor_kind))
     if bool(cfg.get("show_parts", True)):
-        for p in inv.parts:
-            price = float(inv.part_price_with_markup(p.part_price or 0.0) or 0.0)
-            rows.append((p.part_name or "Part", "1", _money(price), price, cfg.get("parts_title", "Parts")))
+        parts = list(inv.parts)
+        parts_kind = cfg.get("parts_title", "Parts")
+        part_prices, parts_sum = _part_prices_and_total(inv, parts)
+        # Qty is always 1, so the unit price text doubles as the amount text.
+        for p, price in zip(parts, part_prices):
+            price_txt = _money(price)
+            rows.append((p.part_name or "Part", "1", price_txt, price_txt, parts_kind))
     if bool(cfg.get("show_shop_supplies", True)) and float(inv.shop_supplies or 0.0):
-        amt = float(inv.shop_supplies or 0.0)
-        rows.append((cfg.get("shop_supplies_label", "Additional Fees"), "1", _money(amt), amt, "Fees"))
+        amt_txt = _money(float(inv.shop_supplies or 0.0))
+        rows.append((cfg.get("shop_supplies_label", "Additional Fees"), "1", amt_txt, amt_txt, "Fees"))
+
+    # Rows are laid out first and drawn per page grouped by text style, so each
+    # style's font/colour operators are emitted once per page instead of per cell.
+    title_cells: list[tuple[float, str]] = []
+    detail_cells: list[tuple[float, str]] = []
+    figure_cells: list[tuple[float, str, str]] = []
+    amount_cells: list[tuple[float, str]] = []
+    divider_ys: list[float] = []
+
+    def flush_rows() -> None:
+        if not title_cells:
+            return
+        pdf.setFillColor(ink)
+        pdf.setFont("Helvetica-Bold", 10)
+        for y, txt in title_cells:
+            pdf.drawString(x_desc + 10, y, txt)
+        for y, txt in amount_cells:
+            pdf.drawRightString(x_amt + col_amt - 8, y, txt)
+        pdf.setFont("Helvetica", 10)
+        for y, qty, rate_txt in figure_cells:
+            pdf.drawRightString(x_qty + col_qty - 8, y, qty)
+            pdf.drawRightString(x_rate + col_rate - 8, y, rate_txt)
+        pdf.setFont("Helvetica", 9)
+        pdf.setFillColor(muted)
+        for y, txt in detail_cells:
+            pdf.drawString(x_desc + 10, y, txt)
+        pdf.setStrokeColor(line)
+        pdf.lines([(right_x0, y, right_x0 + right_w, y) for y in divider_ys])
+        for bucket in (title_cells, detail_cells, figure_cells, amount_cells, divider_ys):
+            bucket.clear()
 
-    pdf.setStrokeColor(line)
-    for desc, qty, rate_txt, amount, kind in rows:
-        desc_lines = _wrap_text(desc, "Helvetica", 10, col_desc - 22)[:2] or [desc]
+    for desc, qty, rate_txt, amount_txt, kind in rows:
+        desc_lines = _wrap_text(desc, "Helvetica", 10, col_desc - 22, max_lines=2) or [desc]
         needed = 18 + len(desc_lines) * 12
         if row_y - needed < min_y:
+            flush_rows()
             row_y = table_cont_page()
-        pdf.setFillColor(ink)
-        pdf.setFont("Helvetica-Bold", 10)
-        pdf.drawString(x_desc + 10, row_y, desc_lines[0])
+        title_cells.append((row_y, desc_lines[0]))
         yy = row_y - 12
         if len(desc_lines) > 1:
-            pdf.setFont("Helvetica", 9)
-            pdf.setFillColor(muted)
-            pdf.drawString(x_desc + 10, yy, desc_lines[1])
+            detail_cells.append((yy, desc_lines[1]))
             yy -= 12
-        pdf.setFont("Helvetica", 9)
-        pdf.setFillColor(muted)
-        pdf.drawString(x_desc + 10, yy, kind)
-        pdf.setFillColor(ink)
-        right_text(x_qty + col_qty - 8, row_y, qty, "Helvetica", 10, ink)
-        right_text(x_rate + col_rate - 8, row_y, rate_txt, "Helvetica", 10, ink)
-        right_text(x_amt + col_amt - 8, row_y, _money(amount), "Helvetica-Bold", 10, ink)
-        pdf.setStrokeColor(line)
-        pdf.line(right_x0, yy - 8, right_x0 + right_w, yy - 8)
+        detail_cells.append((yy, kind))
+        figure_cells.append((row_y, qty, rate_txt))
+        amount_cells.append((row_y, amount_txt))
+        divider_ys.append(yy - 8)
         row_y = yy - 22
+    flush_rows()
 
     # Totals
-    subtotal = float((inv.labor_total() if bool(cfg.get("show_labor", True)) else 0.0) + (inv.parts_total() if bool(cfg.get("show_parts", True)) else 0.0))
+    # labor_total() is hours * rate (no item walk); the parts total was summed with the rows.
+    subtotal = float((inv.labor_total() if bool(cfg.get("show_labor", True)) else 0.0) + parts_sum)
     if bool(cfg.get("show_shop_supplies", True)):
         subtotal += float(inv.shop_supplies or 0.0)
     tax = float(inv.tax_amount() or 0.0)
@@ -4606,13 +4836,11 @@ def _render_blueprint_pdf(
     pdf.setFillColor(colors.white)
     pdf.setStrokeColor(line)
     pdf.roundRect(right_x0, notes_y - 0.65 * inch, right_w, 0.65 * inch, 8, stroke=1, fill=1)
-    pdf.setFillColor(accent)
-    pdf.setFont("Helvetica-Bold", 10)
-    pdf.drawString(right_x0 + 10, notes_y - 16, "NOTES")
+    left_text(right_x0 + 10, notes_y - 16, "NOTES", "Helvetica-Bold", 10, accent)
     pdf.setFillColor(ink)
     pdf.setFont("Helvetica", 9)
     note_text = (inv.notes or "Thank you for your business.").strip()
-    note_line = _wrap_text(note_text, "Helvetica", 9, right_w - 24)[0]
+    note_line = _wrap_text(note_text, "Helvetica", 9, right_w - 24, max_lines=1)[0]
     pdf.drawString(right_x0 + 10, notes_y - 31, note_line)
     if not is_estimate:
         _draw_payment_methods_footer(
@@ -4625,11 +4853,11 @@ def _render_blueprint_pdf(
             text_color=colors.HexColor("#cbd5e1"),
         )
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
     return pdf_path
 
 
@@ -4648,9 +4876,10 @@ def _render_luxe_pdf(
     doc_label: str,
     generated_dt: datetime,
     generated_str: str,
-    owner_logo_abs: str,
-    owner_logo_blob: bytes | None,
+    owner_logo: tuple[ImageReader, int, int] | None,
     is_estimate: bool,
+    out_stream=None,
+    commit: bool = True,
 ):
     PAGE_W, PAGE_H = LETTER
     M = 0.55 * inch
@@ -4663,22 +4892,35 @@ def _render_luxe_pdf(
     line = colors.HexColor("#d9cfbf")
     card = colors.HexColor("#fffdf8")
 
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = _StateTrackingCanvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"{doc_label.title()} - {display_no}")
     total_with_fees, due_with_fees, late_fee_amount = _invoice_pdf_amounts(inv, owner, is_estimate=is_estimate)
 
+    draw_left = pdf.drawString
+    draw_right = pdf.drawRightString
+
+    def left_text(x, y, text, font="Helvetica", size=10, color=ink):
+        pdf.setFont(font, size)
+        pdf.setFillColor(color)
+        draw_left(x, y, str(text or ""))
+
     def right_text(x, y, text, font="Helvetica", size=10, color=ink):
         pdf.setFont(font, size)
         pdf.setFillColor(color)
-        pdf.drawRightString(x, y, str(text or ""))
+        draw_right(x, y, str(text or ""))
 
     def draw_header_band():
-        pdf.setFillColor(bg)
-        pdf.rect(0, 0, PAGE_W, PAGE_H, stroke=0, fill=1)
-        pdf.setFillColor(navy)
-        pdf.roundRect(M, PAGE_H - M - 1.55 * inch, PAGE_W - (2 * M), 1.55 * inch, 14, stroke=0, fill=1)
-        pdf.setFillColor(royal)
-        pdf.roundRect(M, PAGE_H - M - 1.72 * inch, PAGE_W - (2 * M), 0.17 * inch, 8, stroke=0, fill=1)
+        # Background and band never change between pages, so they live in a reusable form XObject.
+        if not pdf.hasForm("luxe_header_band"):
+            pdf.beginForm("luxe_header_band")
+            pdf.setFillColor(bg)
+            pdf.rect(0, 0, PAGE_W, PAGE_H, stroke=0, fill=1)
+            pdf.setFillColor(navy)
+            pdf.roundRect(M, PAGE_H - M - 1.55 * inch, PAGE_W - (2 * M), 1.55 * inch, 14, stroke=0, fill=1)
+            pdf.setFillColor(royal)
+            pdf.roundRect(M, PAGE_H - M - 1.72 * inch, PAGE_W - (2 * M), 0.17 * inch, 8, stroke=0, fill=1)
+            pdf.endForm()
+        pdf.doForm("luxe_header_band")
 
     draw_header_band()
 
@@ -4688,32 +4930,19 @@ def _render_luxe_pdf(
     chip_w = 1.2 * inch
     chip_h = 1.1 * inch
     logo_drawn = False
-    if owner_logo_blob:
+    if owner_logo is not None:
         try:
-            img = ImageReader(io.BytesIO(owner_logo_blob))
             pdf.setFillColor(colors.white)
             pdf.roundRect(chip_x, chip_y_top - chip_h, chip_w, chip_h, 10, stroke=0, fill=1)
-            pdf.drawImage(img, chip_x + 8, chip_y_top - chip_h + 8, width=chip_w - 16, height=chip_h - 16, preserveAspectRatio=True, mask="auto", anchor="c")
-            logo_drawn = True
-        except Exception:
-            logo_drawn = False
-    elif owner_logo_abs and os.path.exists(owner_logo_abs):
-        try:
-            img = ImageReader(owner_logo_abs)
-            pdf.setFillColor(colors.white)
-            pdf.roundRect(chip_x, chip_y_top - chip_h, chip_w, chip_h, 10, stroke=0, fill=1)
-            pdf.drawImage(img, chip_x + 8, chip_y_top - chip_h + 8, width=chip_w - 16, height=chip_h - 16, preserveAspectRatio=True, mask="auto", anchor="c")
+            pdf.drawImage(owner_logo[0], chip_x + 8, chip_y_top - chip_h + 8, width=chip_w - 16, height=chip_h - 16, preserveAspectRatio=True, mask="auto", anchor="c")
             logo_drawn = True
         except Exception:
             logo_drawn = False
 
     # header text
-    business = (_business_header_name(owner) or "").strip()
     owner_info_lines = _business_header_info_lines(owner)
     header_x = chip_x + (chip_w + 16 if logo_drawn else 0)
-    pdf.setFillColor(colors.white)
-    pdf.setFont("Helvetica-Bold", 23)
-    pdf.drawString(header_x, PAGE_H - M - 34, doc_label)
+    left_text(header_x, PAGE_H - M - 34, doc_label, "Helvetica-Bold", 23, colors.white)
     pdf.setFillColor(colors.HexColor("#eadac6"))
     pdf.setFont("Helvetica-Bold", 11)
     header_display_name = _business_header_display_name(owner, "Your Business")
@@ -4743,15 +4972,11 @@ def _render_luxe_pdf(
         pdf.setFillColor(card)
         pdf.setStrokeColor(line)
         pdf.roundRect(x, cards_top - card_h, w, card_h, 12, stroke=1, fill=1)
-    pdf.setFillColor(royal)
-    pdf.setFont("Helvetica-Bold", 10)
-    pdf.drawString(left_x + 12, cards_top - 16, "BILLED TO")
-    pdf.setFillColor(ink)
-    pdf.setFont("Helvetica-Bold", 12)
-    pdf.drawString(left_x + 12, cards_top - 34, (inv.name or getattr(customer, "name", None) or "Customer"))
+    left_text(left_x + 12, cards_top - 16, "BILLED TO", "Helvetica-Bold", 10, royal)
+    left_text(left_x + 12, cards_top - 34, (inv.name or getattr(customer, "name", None) or "Customer"), "Helvetica-Bold", 12)
     pdf.setFont("Helvetica", 10)
     by = cards_top - 49
-    for ln in _wrap_text(customer_address or "", "Helvetica", 10, left_w - 24)[:2]:
+    for ln in _wrap_text(customer_address or "", "Helvetica", 10, left_w - 24, max_lines=2):
         pdf.drawString(left_x + 12, by, ln)
         by -= 12
     if customer_phone:
@@ -4760,12 +4985,8 @@ def _render_luxe_pdf(
         pdf.drawString(left_x + 12, by, customer_email)
 
     due_amt = due_with_fees if not is_estimate else total_with_fees
-    pdf.setFillColor(royal)
-    pdf.setFont("Helvetica-Bold", 10)
-    pdf.drawString(right_x + 12, cards_top - 16, "TOTAL DUE" if not is_estimate else "ESTIMATE TOTAL")
-    pdf.setFillColor(ink)
-    pdf.setFont("Helvetica-Bold", 20)
-    pdf.drawString(right_x + 12, cards_top - 42, _money(due_amt))
+    left_text(right_x + 12, cards_top - 16, "TOTAL DUE" if not is_estimate else "ESTIMATE TOTAL", "Helvetica-Bold", 10, royal)
+    left_text(right_x + 12, cards_top - 42, _money(due_amt), "Helvetica-Bold", 20)
     pdf.setFont("Helvetica", 10)
     pdf.setFillColor(muted)
     paid_state = "Paid" if float(due_with_fees or 0.0) <= 0.0 else "Open"
@@ -4795,9 +5016,7 @@ def _render_luxe_pdf(
         panel_h = 24
         pdf.setFillColor(navy)
         pdf.roundRect(x, y_top - panel_h, w, panel_h, 8, stroke=0, fill=1)
-        pdf.setFillColor(cyan)
-        pdf.setFont("Helvetica-Bold", 11)
-        pdf.drawString(x + 10, y_top - 16, title)
+        left_text(x + 10, y_top - 16, title, "Helvetica-Bold", 11, cyan)
         return y_top - panel_h - 14
 
     def draw_rows(
@@ -4816,33 +5035,44 @@ def _render_luxe_pdf(
         pdf.setFillColor(muted)
         pdf.setFont("Helvetica-Bold", 9)
         pdf.drawString(hx[0] + 8, y, headers[0])
-        right_text(hx[1] + col2 - 8, y, headers[1], "Helvetica-Bold", 9, muted)
-        right_text(hx[2] + col3 - 8, y, headers[2], "Helvetica-Bold", 9, muted)
+        pdf.drawRightString(hx[1] + col2 - 8, y, str(headers[1] or ""))
+        pdf.drawRightString(hx[2] + col3 - 8, y, str(headers[2] or ""))
         y -= 10
         pdf.setStrokeColor(line)
         pdf.line(x, y, x + w, y)
         y -= 8
+        # Lay out this page's rows first, then draw them grouped by text style.
+        desc_cells: list[tuple[float, str]] = []
+        figure_cells: list[tuple[float, str, str]] = []
+        divider_ys: list[float] = []
         idx = max(0, int(start_index))
         while idx < len(rows):
             c1, c2, c3 = rows[idx]
-            desc_lines = _wrap_text(c1, "Helvetica", 10, col1 - 16)[:2] or [c1]
+            desc_lines = _wrap_text(c1, "Helvetica", 10, col1 - 16, max_lines=2) or [c1]
             needed = len(desc_lines) * 10 + 10
             if y - needed < min_bottom:
-                return y, idx
-            pdf.setFillColor(ink)
-            pdf.setFont("Helvetica", 10)
+                break
             y0 = y
             for ln in desc_lines:
-                pdf.drawString(hx[0] + 8, y, ln); y -= 10
-            right_text(hx[1] + col2 - 8, y0, c2, "Helvetica", 10, ink)
-            right_text(hx[2] + col3 - 8, y0, c3, "Helvetica-Bold", 10, ink)
+                desc_cells.append((y, ln)); y -= 10
+            figure_cells.append((y0, str(c2 or ""), str(c3 or "")))
             row_bottom = y0 - (len(desc_lines) * 10)
-            line_y = row_bottom + 2
-            pdf.setStrokeColor(line)
-            pdf.line(x, line_y, x + w, line_y)
             # Keep item spacing stable; only adjust where separator lines are drawn.
+            divider_ys.append(row_bottom + 2)
             y = row_bottom - 10
             idx += 1
+        if figure_cells:
+            pdf.setFillColor(ink)
+            pdf.setFont("Helvetica", 10)
+            for cell_y, txt in desc_cells:
+                pdf.drawString(hx[0] + 8, cell_y, txt)
+            for cell_y, qty_txt, _ in figure_cells:
+                pdf.drawRightString(hx[1] + col2 - 8, cell_y, qty_txt)
+            pdf.setFont("Helvetica-Bold", 10)
+            for cell_y, _, amount_txt in figure_cells:
+                pdf.drawRightString(hx[2] + col3 - 8, cell_y, amount_txt)
+            pdf.setStrokeColor(line)
+            pdf.lines([(x, line_y, x + w, line_y) for line_y in divider_ys])
         return y, idx
 
     tables_top = cards_top - card_h - 18
@@ -4852,45 +5082,39 @@ def _render_luxe_pdf(
     def new_cont_page():
         pdf.showPage()
         draw_header_band()
-        pdf.setFillColor(colors.white)
-        pdf.setFont("Helvetica-Bold", 18)
-        pdf.drawString(chip_x + chip_w + 16, PAGE_H - M - 34, f"{doc_label} (cont.)")
+        left_text(chip_x + chip_w + 16, PAGE_H - M - 34, f"{doc_label} (cont.)", "Helvetica-Bold", 18, colors.white)
         return PAGE_H - M - 1.85 * inch
 
     # Labor table
     labor_rows: list[tuple[str, str, str]] = []
     if bool(cfg.get("show_labor", True)):
         rate = float(inv.price_per_hour or 0.0)
-        for li in inv.labor_items:
-            hrs = float(li.labor_time_hours or 0.0)
-            if hrs <= 0:
-                continue
-            labor_rows.append((li.labor_desc or "Service labor", f"{hrs:g} hrs", _money(hrs * rate)))
+        labor_hours = [(li.labor_desc or "Service labor", _to_float(li.labor_time_hours)) for li in inv.labor_items]
+        labor_rows = [(desc, f"{hrs:g} hrs", _money(hrs * rate)) for desc, hrs in labor_hours if hrs > 0]
     labor_title = (cfg.get("labor_title") or "Labor").upper()
     labor_desc_label = cfg.get("labor_desc_label", "Description")
     labor_time_label = cfg.get("labor_time_label", "Hours")
     labor_total_label = cfg.get("labor_total_label", "Line Total")
+    labor_headers = [labor_desc_label, labor_time_label, labor_total_label]
     has_labor_rows = bool(labor_rows)
     y = tables_top - 8
     if has_labor_rows:
         y = table_panel(M, tables_top, table_w, labor_title)
         labor_idx = 0
-        y, labor_idx = draw_rows(
-            M, y, table_w, [labor_desc_label, labor_time_label, labor_total_label], labor_rows, min_bottom, labor_idx
-        )
+        y, labor_idx = draw_rows(M, y, table_w, labor_headers, labor_rows, min_bottom, labor_idx)
+        labor_cont_title = f"{labor_title} (CONT.)"
         while labor_idx < len(labor_rows):
             tables_top = new_cont_page()
-            y = table_panel(M, tables_top, table_w, f"{labor_title} (CONT.)")
-            y, labor_idx = draw_rows(
-                M, y, table_w, [labor_desc_label, labor_time_label, labor_total_label], labor_rows, min_bottom, labor_idx
-            )
+            y = table_panel(M, tables_top, table_w, labor_cont_title)
+            y, labor_idx = draw_rows(M, y, table_w, labor_headers, labor_rows, min_bottom, labor_idx)
 
     # Parts table (separate always)
     parts_rows: list[tuple[str, str, str]] = []
+    parts_sum = 0.0
     if bool(cfg.get("show_parts", True)):
-        for p in inv.parts:
-            price = float(inv.part_price_with_markup(p.part_price or 0.0) or 0.0)
-            parts_rows.append((p.part_name or "Part", "1", _money(price)))
+        parts = list(inv.parts)
+        part_prices, parts_sum = _part_prices_and_total(inv, parts)
+        parts_rows = [(p.part_name or "Part", "1", _money(price)) for p, price in zip(parts, part_prices)]
     has_parts_rows = bool(parts_rows)
     parts_top = y - 8
     if has_parts_rows and parts_top < (min_bottom + 110):
@@ -4898,22 +5122,21 @@ def _render_luxe_pdf(
     parts_title = (cfg.get("parts_title") or "Parts").upper()
     parts_name_label = cfg.get("parts_name_label", "Part / Material")
     parts_price_label = cfg.get("parts_price_label", "Price")
+    parts_headers = [parts_name_label, "Qty", parts_price_label]
     y2 = y
     if has_parts_rows:
         y2 = table_panel(M, parts_top, table_w, parts_title)
         parts_idx = 0
-        y2, parts_idx = draw_rows(
-            M, y2, table_w, [parts_name_label, "Qty", parts_price_label], parts_rows, min_bottom, parts_idx
-        )
+        y2, parts_idx = draw_rows(M, y2, table_w, parts_headers, parts_rows, min_bottom, parts_idx)
+        parts_cont_title = f"{parts_title} (CONT.)"
         while parts_idx < len(parts_rows):
             parts_top = new_cont_page()
-            y2 = table_panel(M, parts_top, table_w, f"{parts_title} (CONT.)")
-            y2, parts_idx = draw_rows(
-                M, y2, table_w, [parts_name_label, "Qty", parts_price_label], parts_rows, min_bottom, parts_idx
-            )
+            y2 = table_panel(M, parts_top, table_w, parts_cont_title)
+            y2, parts_idx = draw_rows(M, y2, table_w, parts_headers, parts_rows, min_bottom, parts_idx)
 
     # Footer totals strip
-    subtotal = float((inv.labor_total() if bool(cfg.get("show_labor", True)) else 0.0) + (inv.parts_total() if bool(cfg.get("show_parts", True)) else 0.0))
+    # labor_total() is hours * rate (no item walk); the parts total was summed with the rows.
+    subtotal = float((inv.labor_total() if bool(cfg.get("show_labor", True)) else 0.0) + parts_sum)
     if bool(cfg.get("show_shop_supplies", True)):
         subtotal += float(inv.shop_supplies or 0.0)
     tax = float(inv.tax_amount() or 0.0)
@@ -4929,12 +5152,12 @@ def _render_luxe_pdf(
     pdf.roundRect(M, fy - 46, table_w, 46, 10, stroke=0, fill=1)
     pdf.setFillColor(colors.white)
     pdf.setFont("Helvetica", 11)
-    subtotal_line = f"Subtotal {_money(subtotal)}"
+    subtotal_parts = [f"Subtotal {_money(subtotal)}"]
     if tax > 0:
-        subtotal_line = f"{subtotal_line}   •   {_tax_label(inv)} {_money(tax)}"
+        subtotal_parts.append(f"{_tax_label(inv)} {_money(tax)}")
     if late_fee_amount > 0 and not is_estimate:
-        subtotal_line = f"{subtotal_line}   •   Late Fee {_money(late_fee_amount)}"
-    pdf.drawString(M + 12, fy - 18, subtotal_line)
+        subtotal_parts.append(f"Late Fee {_money(late_fee_amount)}")
+    pdf.drawString(M + 12, fy - 18, "   •   ".join(subtotal_parts))
     right_text(PAGE_W - M - 12, fy - 18, f"Total {_money(total)}", "Helvetica-Bold", 12, colors.white)
     if not is_estimate:
         pdf.setFillColor(colors.HexColor("#eadac6"))
@@ -4945,25 +5168,300 @@ def _render_luxe_pdf(
     pdf.setFillColor(card)
     pdf.setStrokeColor(line)
     pdf.roundRect(M, notes_bottom, table_w, notes_h, 10, stroke=1, fill=1)
-    pdf.setFillColor(royal)
-    pdf.setFont("Helvetica-Bold", 10)
-    pdf.drawString(M + 10, notes_top - 15, "NOTES")
+    left_text(M + 10, notes_top - 15, "NOTES", "Helvetica-Bold", 10, royal)
     note_text = (inv.notes or "Thank you for your business.").strip()
-    note_line = _wrap_text(note_text, "Helvetica", 9, table_w - 22)[0]
-    pdf.setFillColor(ink)
-    pdf.setFont("Helvetica", 9)
-    pdf.drawString(M + 10, notes_top - 30, note_line)
+    note_line = _wrap_text(note_text, "Helvetica", 9, table_w - 22, max_lines=1)[0]
+    left_text(M + 10, notes_top - 30, note_line, "Helvetica", 9)
     if not is_estimate:
         _draw_payment_methods_footer(pdf, owner, M, M + 0.02 * inch, table_w)
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
     return pdf_path
 
 
+# Invoice template / profession config (locked per invoice). Shared across renders,
+# so the mappings are read-only; generate_and_store_pdf copies before customizing.
+TEMPLATE_CFG = MappingProxyType({
+    "auto_repair": MappingProxyType({
+        "job_label": "Vehicle",
+        "job_box_title": "JOB DETAILS",
+        "job_rate_label": "Rate/Hour",
+        "job_hours_label": "Total Hours",
+        "hours_suffix": "hrs",
+
+        "labor_title": "Labor",
+        "labor_desc_label": "Description",
+        "labor_time_label": "Time",
+        "labor_total_label": "Line Total",
+
+        "parts_title": "Parts",
+        "parts_name_label": "Part Name",
+        "parts_price_label": "Price",
+
+        "shop_supplies_label": "Shop Supplies",
+    }),
+    "general_service": MappingProxyType({
+        "job_label": "Job / Project",
+        "job_box_title": "JOB DETAILS",
+        "job_rate_label": "Rate/Hour",
+        "job_hours_label": "Total Hours",
+        "hours_suffix": "hrs",
+
+        "labor_title": "Services",
+        "labor_desc_label": "Description",
+        "labor_time_label": "Time",
+        "labor_total_label": "Line Total",
+
+        "parts_title": "Materials",
+        "parts_name_label": "Material",
+        "parts_price_label": "Price",
+
+        "shop_supplies_label": "Supplies / Fees",
+    }),
+    "accountant": MappingProxyType({
+        "job_label": "Engagement",
+        "job_box_title": "ENGAGEMENT DETAILS",
+        "job_rate_label": "Hourly Rate",
+        "job_hours_label": "Hours Billed",
+        "hours_suffix": "hrs",
+
+        "labor_title": "Services",
+        "labor_desc_label": "Description",
+        "labor_time_label": "Hours",
+        "labor_total_label": "Line Total",
+
+        "parts_title": "Expenses",
+        "parts_name_label": "Expense",
+        "parts_price_label": "Amount",
+
+        "shop_supplies_label": "Admin Fees",
+    }),
+    "computer_repair": MappingProxyType({
+        "job_label": "Device",
+        "job_box_title": "DEVICE DETAILS",
+        "job_rate_label": "Rate/Hour",
+        "job_hours_label": "Total Hours",
+        "hours_suffix": "hrs",
+
+        "labor_title": "Services",
+        "labor_desc_label": "Description",
+        "labor_time_label": "Time",
+        "labor_total_label": "Line Total",
+
+        "parts_title": "Parts",
+        "parts_name_label": "Part Name",
+        "parts_price_label": "Price",
+
+        "shop_supplies_label": "Shop Supplies",
+    }),
+    "lawn_care": MappingProxyType({
+        "job_label": "Service Address",
+        "job_box_title": "PROPERTY DETAILS",
+        "job_rate_label": "Rate",
+        "job_hours_label": "Units / Hours",
+        "hours_suffix": "hrs",
+
+        "labor_title": "Services",
+        "labor_desc_label": "Description",
+        "labor_time_label": "Qty / Time",
+        "labor_total_label": "Line Total",
+
+        "parts_title": "Materials",
+        "parts_name_label": "Material",
+        "parts_price_label": "Amount",
+
+        "shop_supplies_label": "Disposal / Trip Fees",
+    }),
+    "flipping_items": MappingProxyType({
+        "job_label": "Item",
+        "job_box_title": "ITEM DETAILS",
+        "job_rate_label": "Sale Price",
+        "job_hours_label": "Quantity",
+        "hours_suffix": "qty",
+
+        "labor_title": "Sales",
+        "labor_desc_label": "Description",
+        "labor_time_label": "Qty",
+        "labor_total_label": "Line Total",
+
+        "parts_title": "Costs",
+        "parts_name_label": "Cost Item",
+        "parts_price_label": "Amount",
+
+        "shop_supplies_label": "Other Expenses",
+    }),
+    "custom": MappingProxyType({
+        "job_label": "Job / Project",
+        "job_box_title": "JOB DETAILS",
+        "job_rate_label": "Rate/Hour",
+        "job_hours_label": "Total Hours",
+        "hours_suffix": "hrs",
+        "profession_label": "Custom",
+        "labor_title": "Services",
+        "labor_desc_label": "Description",
+        "labor_time_label": "Time",
+        "labor_total_label": "Line Total",
+        "parts_title": "Items",
+        "parts_name_label": "Item Name",
+        "parts_price_label": "Price",
+        "shop_supplies_label": "Additional Fees",
+        "show_job": True,
+        "show_labor": True,
+        "show_parts": True,
+        "show_shop_supplies": True,
+        "show_notes": True,
+    }),
+})
+
+# Render-only switches accepted through custom_cfg_override even though no
+# profession template defines them.
+_CFG_RENDER_FLAGS = frozenset({"fast_mode"})
+
+# pdf_template_key -> (renderer, keyword arguments it takes beyond the common set).
+# "classic" is drawn inline by _render_and_store_pdf.
+_PDF_RENDERERS = {
+    "modern": (_render_modern_pdf, ("template_key", "owner_logo", "builder_cfg")),
+    "split_panel": (_render_split_panel_pdf, ("template_key", "owner_logo", "builder_cfg")),
+    "strip": (_render_strip_pdf, ("template_key", "owner_logo", "builder_cfg")),
+    "basic": (_render_basic_pdf, ()),
+    "simple": (_render_simple_pdf, ("owner_logo",)),
+    "blueprint": (_render_blueprint_pdf, ("owner_logo",)),
+    "luxe": (_render_luxe_pdf, ("owner_logo",)),
+}
+
+
+# Bump when renderer output changes so PDFs stored under an older hash are redrawn.
+_PDF_CONTENT_HASH_VERSION = 1
+
+# Columns that change without affecting what a PDF looks like; leaving them out
+# of the content hash keeps unrelated writes from forcing a re-render.
+_PDF_HASH_SKIP_COLUMNS = {
+    "invoices": frozenset({
+        "pdf_path",
+        "pdf_generated_at",
+        "pdf_content_hash",
+        "payment_reminder_before_sent_at",
+        "payment_reminder_due_today_sent_at",
+        "payment_reminder_after_sent_at",
+        "payment_reminder_last_sent_at",
+        "autopay_last_attempt_at",
+        "autopay_last_error",
+        "updated_at",
+    }),
+    "users": frozenset({
+        "password_hash",
+        "failed_login_attempts",
+        "password_reset_required",
+        "last_failed_login",
+        "schedule_summary_last_sent",
+        "payment_reminder_last_run_at",
+        "client_autopay_last_run_at",
+        "stripe_connect_last_synced_at",
+        "updated_at",
+    }),
+    "customers": frozenset({"updated_at"}),
+}
+
+
+def _active_design_json(session, owner_id: int) -> str | None:
+    """design_json of the owner's active builder template (selects the one column, not the row)."""
+    return (
+        session.query(InvoiceDesignTemplate.design_json)
+        .filter(
+            InvoiceDesignTemplate.user_id == owner_id,
+            InvoiceDesignTemplate.is_active.is_(True),
+        )
+        .order_by(InvoiceDesignTemplate.updated_at.desc(), InvoiceDesignTemplate.id.desc())
+        .limit(1)
+        .scalar()
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_design_json(design_json: str):
+    # Keyed on the JSON text itself, so an edited design is never served stale.
+    # The result is shared between renders; _render_invoice_builder_pdf only reads it.
+    try:
+        return json.loads(design_json)
+    except Exception:
+        return None
+
+
+def _owner_local_now(owner: User | None) -> datetime:
+    offset_minutes = int(getattr(owner, "schedule_summary_tz_offset_minutes", 0) or 0) if owner else 0
+    offset_minutes = max(-720, min(840, offset_minutes))
+    return datetime.utcnow() + timedelta(minutes=offset_minutes)
+
+
+def _pdf_hash_row(obj) -> list | None:
+    if obj is None:
+        return None
+    table = obj.__table__
+    skip = _PDF_HASH_SKIP_COLUMNS.get(table.name, frozenset())
+    row = []
+    for col in table.columns:
+        if col.key in skip:
+            continue
+        val = getattr(obj, col.key, None)
+        if isinstance(val, (bytes, bytearray, memoryview)):
+            val = hashlib.blake2b(bytes(val), digest_size=16).hexdigest()
+        row.append((col.key, val))
+    return row
+
+
+def _pdf_content_hash(
+    session,
+    inv: Invoice,
+    *,
+    custom_cfg_override: dict | None,
+    pdf_template_override: str | None,
+    builder_cfg_override: dict | None,
+    invoice_builder_design_override: dict | None,
+    include_processing_fee: bool,
+) -> str:
+    """Digest of everything generate_and_store_pdf reads to draw the invoice."""
+    owner = inv.user if inv.user_id else None
+    customer = inv.customer if inv.customer_id else None
+
+    logo_mtime = None
+    logo_rel = (getattr(owner, "logo_path", None) or "").strip() if owner else ""
+    if logo_rel:
+        try:
+            logo_mtime = os.stat(_instance_logo_path(logo_rel)).st_mtime_ns
+        except OSError:
+            logo_mtime = None
+
+    design = invoice_builder_design_override
+    if not isinstance(design, dict) and owner is not None:
+        design = None
+        if _invoice_builder_cfg(owner, override=builder_cfg_override).get("enabled", False):
+            design = _active_design_json(session, owner.id)
+
+    state = {
+        "version": _PDF_CONTENT_HASH_VERSION,
+        # The page shows the generation date, and late fees accrue per day.
+        "day": _owner_local_now(owner).date().isoformat(),
+        "invoice": _pdf_hash_row(inv),
+        "parts": [_pdf_hash_row(p) for p in inv.parts],
+        "labor": [_pdf_hash_row(li) for li in inv.labor_items],
+        "owner": _pdf_hash_row(owner),
+        "customer": _pdf_hash_row(customer),
+        "logo_mtime": logo_mtime,
+        "design": design,
+        "custom_cfg_override": custom_cfg_override,
+        "pdf_template_override": pdf_template_override,
+        "builder_cfg_override": builder_cfg_override,
+        "include_processing_fee": bool(include_processing_fee),
+    }
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps(state, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
 def generate_and_store_pdf(
     session,
     invoice_id: int,
@@ -4972,16 +5470,83 @@ def generate_and_store_pdf(
     builder_cfg_override: dict | None = None,
     invoice_builder_design_override: dict | None = None,
     include_processing_fee: bool = False,
+    out_stream=None,
+    commit: bool = True,
+    force: bool = False,
 ) -> str:
     """
     Generates (or regenerates) a PDF for the given invoice_id.
     Saves to disk (Option A) and updates invoice.pdf_path + invoice.pdf_generated_at.
+    When out_stream is given, the same bytes are also written to it so callers
+    can serve the PDF without reading the file back from disk.
+    With commit=False the updated invoice is only added to the session and the
+    caller is responsible for committing (see generate_and_store_pdfs).
+
+    If nothing the PDF depends on has changed since the stored file was drawn
+    (same invoice.pdf_content_hash, file still on disk), that file is reused
+    instead of rendering again. Pass force=True to always redraw.
 
     Returns: absolute pdf path on disk.
     """
-    inv = session.get(Invoice, invoice_id)
+    # Every renderer reads the owner and customer and walks both item collections:
+    # join the two rows into the invoice query and load each collection in one more.
+    inv = session.get(
+        Invoice,
+        invoice_id,
+        options=[
+            joinedload(Invoice.user),
+            joinedload(Invoice.customer),
+            selectinload(Invoice.parts),
+            selectinload(Invoice.labor_items),
+        ],
+    )
     if not inv:
         raise ValueError(f"Invoice not found: id={invoice_id}")
+
+    hash_inputs = dict(
+        custom_cfg_override=custom_cfg_override,
+        pdf_template_override=pdf_template_override,
+        builder_cfg_override=builder_cfg_override,
+        invoice_builder_design_override=invoice_builder_design_override,
+        include_processing_fee=include_processing_fee,
+    )
+    if not force and _pdf_content_hash(session, inv, **hash_inputs) == inv.pdf_content_hash and inv.pdf_path and os.path.exists(inv.pdf_path):
+        if out_stream is not None:
+            with open(inv.pdf_path, "rb") as fh:
+                out_stream.write(fh.read())
+        return inv.pdf_path
+
+    pdf_path = _render_and_store_pdf(
+        session,
+        inv,
+        custom_cfg_override=custom_cfg_override,
+        pdf_template_override=pdf_template_override,
+        builder_cfg_override=builder_cfg_override,
+        invoice_builder_design_override=invoice_builder_design_override,
+        include_processing_fee=include_processing_fee,
+        out_stream=out_stream,
+        commit=False,
+    )
+    # Hashed after rendering (the renderer may sync inv.pdf_template from the owner) and
+    # only once it succeeded, so a failed render never marks a stale file as current.
+    inv.pdf_content_hash = _pdf_content_hash(session, inv, **hash_inputs)
+    if commit:
+        session.commit()
+    return pdf_path
+
+
+def _render_and_store_pdf(
+    session,
+    inv: Invoice,
+    custom_cfg_override: dict | None = None,
+    pdf_template_override: str | None = None,
+    builder_cfg_override: dict | None = None,
+    invoice_builder_design_override: dict | None = None,
+    include_processing_fee: bool = False,
+    out_stream=None,
+    commit: bool = True,
+) -> str:
+    """Draw inv with its configured template and point invoice.pdf_path at the result."""
     # Transient flag consumed by _invoice_pdf_amounts; not persisted to DB.
     inv._pdf_paid_processing_fee_override = None if include_processing_fee else 0.0
 
@@ -4991,7 +5556,7 @@ def generate_and_store_pdf(
     owner = None
     try:
         if getattr(inv, "user_id", None):
-            owner = session.get(User, inv.user_id)
+            owner = inv.user
     except Exception:
         owner = None
 
@@ -4999,185 +5564,46 @@ def generate_and_store_pdf(
     customer = None
     try:
         if getattr(inv, "customer_id", None):
-            customer = session.get(Customer, inv.customer_id)
+            customer = inv.customer
     except Exception:
         customer = None
 
     # Customer contact priority:
     # invoice override -> customer profile
-    customer_email = (getattr(inv, "customer_email", None) or "").strip() or (
-        (getattr(customer, "email", None) or "").strip() if customer else ""
-    )
-    customer_phone = (getattr(inv, "customer_phone", None) or "").strip() or (
-        (getattr(customer, "phone", None) or "").strip() if customer else ""
-    )
-    customer_phone = _format_phone(customer_phone)
-    customer_address = ((getattr(customer, "address", None) or "").strip() if customer else "")
-
-    # -----------------------------
-    # Invoice template / profession config (locked per invoice)
-    # -----------------------------
-    TEMPLATE_CFG = {
-        "auto_repair": {
-            "job_label": "Vehicle",
-            "job_box_title": "JOB DETAILS",
-            "job_rate_label": "Rate/Hour",
-            "job_hours_label": "Total Hours",
-            "hours_suffix": "hrs",
-
-            "labor_title": "Labor",
-            "labor_desc_label": "Description",
-            "labor_time_label": "Time",
-            "labor_total_label": "Line Total",
-
-            "parts_title": "Parts",
-            "parts_name_label": "Part Name",
-            "parts_price_label": "Price",
-
-            "shop_supplies_label": "Shop Supplies",
-        },
-        "general_service": {
-            "job_label": "Job / Project",
-            "job_box_title": "JOB DETAILS",
-            "job_rate_label": "Rate/Hour",
-            "job_hours_label": "Total Hours",
-            "hours_suffix": "hrs",
-
-            "labor_title": "Services",
-            "labor_desc_label": "Description",
-            "labor_time_label": "Time",
-            "labor_total_label": "Line Total",
-
-            "parts_title": "Materials",
-            "parts_name_label": "Material",
-            "parts_price_label": "Price",
-
-            "shop_supplies_label": "Supplies / Fees",
-        },
-        "accountant": {
-            "job_label": "Engagement",
-            "job_box_title": "ENGAGEMENT DETAILS",
-            "job_rate_label": "Hourly Rate",
-            "job_hours_label": "Hours Billed",
-            "hours_suffix": "hrs",
-
-            "labor_title": "Services",
-            "labor_desc_label": "Description",
-            "labor_time_label": "Hours",
-            "labor_total_label": "Line Total",
-
-            "parts_title": "Expenses",
-            "parts_name_label": "Expense",
-            "parts_price_label": "Amount",
-
-            "shop_supplies_label": "Admin Fees",
-        },
-        "computer_repair": {
-            "job_label": "Device",
-            "job_box_title": "DEVICE DETAILS",
-            "job_rate_label": "Rate/Hour",
-            "job_hours_label": "Total Hours",
-            "hours_suffix": "hrs",
-
-            "labor_title": "Services",
-            "labor_desc_label": "Description",
-            "labor_time_label": "Time",
-            "labor_total_label": "Line Total",
-
-            "parts_title": "Parts",
-            "parts_name_label": "Part Name",
-            "parts_price_label": "Price",
-
-            "shop_supplies_label": "Shop Supplies",
-        },
-        "lawn_care": {
-            "job_label": "Service Address",
-            "job_box_title": "PROPERTY DETAILS",
-            "job_rate_label": "Rate",
-            "job_hours_label": "Units / Hours",
-            "hours_suffix": "hrs",
-
-            "labor_title": "Services",
-            "labor_desc_label": "Description",
-            "labor_time_label": "Qty / Time",
-            "labor_total_label": "Line Total",
-
-            "parts_title": "Materials",
-            "parts_name_label": "Material",
-            "parts_price_label": "Amount",
-
-            "shop_supplies_label": "Disposal / Trip Fees",
-        },
-        "flipping_items": {
-            "job_label": "Item",
-            "job_box_title": "ITEM DETAILS",
-            "job_rate_label": "Sale Price",
-            "job_hours_label": "Quantity",
-            "hours_suffix": "qty",
-
-            "labor_title": "Sales",
-            "labor_desc_label": "Description",
-            "labor_time_label": "Qty",
-            "labor_total_label": "Line Total",
-
-            "parts_title": "Costs",
-            "parts_name_label": "Cost Item",
-            "parts_price_label": "Amount",
-
-            "shop_supplies_label": "Other Expenses",
-        },
-        "custom": {
-            "job_label": "Job / Project",
-            "job_box_title": "JOB DETAILS",
-            "job_rate_label": "Rate/Hour",
-            "job_hours_label": "Total Hours",
-            "hours_suffix": "hrs",
-            "profession_label": "Custom",
-            "labor_title": "Services",
-            "labor_desc_label": "Description",
-            "labor_time_label": "Time",
-            "labor_total_label": "Line Total",
-            "parts_title": "Items",
-            "parts_name_label": "Item Name",
-            "parts_price_label": "Price",
-            "shop_supplies_label": "Additional Fees",
-            "show_job": True,
-            "show_labor": True,
-            "show_parts": True,
-            "show_shop_supplies": True,
-            "show_notes": True,
-        },
-    }
+    customer_email = _coalesce(inv.customer_email, customer.email if customer else None)
+    customer_phone = _format_phone(_coalesce(inv.customer_phone, customer.phone if customer else None))
+    customer_address = _coalesce(customer.address if customer else None)
 
-    template_key = (getattr(inv, "invoice_template", None) or "").strip() or (
-        (getattr(owner, "invoice_template", None) or "").strip() if owner else ""
-    )
+    template_key = _coalesce(inv.invoice_template, owner.invoice_template if owner else None)
     if template_key not in TEMPLATE_CFG:
         template_key = "auto_repair"
     cfg = TEMPLATE_CFG[template_key]
     if template_key == "custom" and owner is not None:
         def _txt(attr: str, fallback: str) -> str:
+            # Owner-entered labels come fresh from the DB on every render; intern
+            # them so they share storage like the built-in template literals.
             val = (getattr(owner, attr, None) or "").strip()
-            return val or fallback
-
-        cfg = dict(cfg)
-        cfg["job_label"] = _txt("custom_job_label", cfg["job_label"])
-        cfg["labor_title"] = _txt("custom_labor_title", cfg["labor_title"])
-        cfg["labor_desc_label"] = _txt("custom_labor_desc_label", cfg["labor_desc_label"])
-        cfg["parts_title"] = _txt("custom_parts_title", cfg["parts_title"])
-        cfg["parts_name_label"] = _txt("custom_parts_name_label", cfg["parts_name_label"])
-        cfg["shop_supplies_label"] = _txt("custom_shop_supplies_label", cfg["shop_supplies_label"])
-        cfg["profession_label"] = _txt("custom_profession_name", cfg.get("profession_label", "Custom"))
-        cfg["show_job"] = bool(getattr(owner, "custom_show_job", True))
-        cfg["show_labor"] = bool(getattr(owner, "custom_show_labor", True))
-        cfg["show_parts"] = bool(getattr(owner, "custom_show_parts", True))
-        cfg["show_shop_supplies"] = bool(getattr(owner, "custom_show_shop_supplies", True))
-        cfg["show_notes"] = bool(getattr(owner, "custom_show_notes", True))
+            return sys.intern(val) if val else fallback
+
+        cfg = {
+            **cfg,
+            "job_label": _txt("custom_job_label", cfg["job_label"]),
+            "labor_title": _txt("custom_labor_title", cfg["labor_title"]),
+            "labor_desc_label": _txt("custom_labor_desc_label", cfg["labor_desc_label"]),
+            "parts_title": _txt("custom_parts_title", cfg["parts_title"]),
+            "parts_name_label": _txt("custom_parts_name_label", cfg["parts_name_label"]),
+            "shop_supplies_label": _txt("custom_shop_supplies_label", cfg["shop_supplies_label"]),
+            "profession_label": _txt("custom_profession_name", cfg.get("profession_label", "Custom")),
+            "show_job": bool(getattr(owner, "custom_show_job", True)),
+            "show_labor": bool(getattr(owner, "custom_show_labor", True)),
+            "show_parts": bool(getattr(owner, "custom_show_parts", True)),
+            "show_shop_supplies": bool(getattr(owner, "custom_show_shop_supplies", True)),
+            "show_notes": bool(getattr(owner, "custom_show_notes", True)),
+        }
     if custom_cfg_override:
-        cfg = dict(cfg)
-        for k, v in custom_cfg_override.items():
-            if k in cfg:
-                cfg[k] = v
+        overrides = {k: v for k, v in custom_cfg_override.items() if k in cfg or k in _CFG_RENDER_FLAGS}
+        if overrides:
+            cfg = {**cfg, **overrides}
     builder_cfg = _invoice_builder_cfg(owner, override=builder_cfg_override)
 
     show_job = bool(cfg.get("show_job", True))
@@ -5185,6 +5611,8 @@ def generate_and_store_pdf(
     show_parts = bool(cfg.get("show_parts", True))
     show_shop_supplies = bool(cfg.get("show_shop_supplies", True))
     show_notes = bool(cfg.get("show_notes", True))
+    labor_title = cfg["labor_title"]
+    parts_title = cfg["parts_title"]
 
     requested_pdf_template = (pdf_template_override or "").strip()
     if requested_pdf_template:
@@ -5198,16 +5626,14 @@ def generate_and_store_pdf(
     if pdf_template_key in PRO_ONLY_PDF_TEMPLATES and not _owner_has_pro_pdf_templates(owner):
         pdf_template_key = "classic"
 
-    # Determine header identity lines (left side)
-    header_name = _business_header_name(owner)
-    header_info_lines = _business_header_info_lines(owner)
-
     # Owner logo (stored relative to instance/)
     owner_logo_rel = (getattr(owner, "logo_path", None) or "").strip() if owner else ""
     owner_logo_abs = ""
     owner_logo_blob = (getattr(owner, "logo_blob", None) if owner else None)
     if owner_logo_rel:
-        owner_logo_abs = str((Path("instance") / owner_logo_rel).resolve())
+        owner_logo_abs = _instance_logo_path(owner_logo_rel)
+    # Resolve (and decode) the logo once here; renderers only receive the result.
+    owner_logo = _owner_logo_image(owner_logo_blob, owner_logo_abs)
 
     # Ensure parts + labor loaded
     parts = inv.parts
@@ -5216,9 +5642,7 @@ def generate_and_store_pdf(
     PAGE_W, PAGE_H = LETTER
     M = 0.75 * inch
 
-    owner_offset_minutes = int(getattr(owner, "schedule_summary_tz_offset_minutes", 0) or 0) if owner else 0
-    owner_offset_minutes = max(-720, min(840, owner_offset_minutes))
-    generated_dt = datetime.utcnow() + timedelta(minutes=owner_offset_minutes)
+    generated_dt = _owner_local_now(owner)
     generated_str = generated_dt.strftime("%B %d, %Y")
 
     display_no = inv.display_number or inv.invoice_number
@@ -5226,7 +5650,7 @@ def generate_and_store_pdf(
     # Year from invoice_number prefix (YYYY######)
     year = (inv.invoice_number or "")[:4]
     if not (len(year) == 4 and year.isdigit()):
-        year = generated_dt.strftime("%Y")
+        year = f"{generated_dt.year:04d}"
 
     exports_dir = Config.EXPORTS_DIR
     year_dir = os.path.join(exports_dir, year)
@@ -5243,20 +5667,9 @@ def generate_and_store_pdf(
         if isinstance(invoice_builder_design_override, dict):
             design_obj = invoice_builder_design_override
         else:
-            active_design = (
-                session.query(InvoiceDesignTemplate)
-                .filter(
-                    InvoiceDesignTemplate.user_id == owner.id,
-                    InvoiceDesignTemplate.is_active.is_(True),
-                )
-                .order_by(InvoiceDesignTemplate.updated_at.desc(), InvoiceDesignTemplate.id.desc())
-                .first()
-            )
-            if active_design and (active_design.design_json or "").strip():
-                try:
-                    design_obj = json.loads(active_design.design_json)
-                except Exception:
-                    design_obj = None
+            design_json = _active_design_json(session, owner.id)
+            if (design_json or "").strip():
+                design_obj = _parse_design_json(design_json)
         if isinstance(design_obj, dict):
             try:
                 return _render_invoice_builder_pdf(
@@ -5269,12 +5682,18 @@ def generate_and_store_pdf(
                     is_estimate=is_estimate,
                     design_obj=design_obj,
                     cfg=cfg,
+                    owner_logo=owner_logo,
+                    out_stream=out_stream,
+                    commit=commit,
                 )
             except Exception:
                 pass
 
-    if pdf_template_key == "modern":
-        return _render_modern_pdf(
+    renderer = _PDF_RENDERERS.get(pdf_template_key)
+    if renderer is not None:
+        render, extra_arg_names = renderer
+        extra_args = {"template_key": template_key, "owner_logo": owner_logo, "builder_cfg": builder_cfg}
+        return render(
             session=session,
             inv=inv,
             owner=owner,
@@ -5283,135 +5702,18 @@ def generate_and_store_pdf(
             customer_phone=customer_phone,
             customer_address=customer_address,
             cfg=cfg,
-            template_key=template_key,
             pdf_path=pdf_path,
             display_no=display_no,
             doc_label=doc_label,
             generated_dt=generated_dt,
             generated_str=generated_str,
-            owner_logo_abs=owner_logo_abs,
-            owner_logo_blob=owner_logo_blob,
-            is_estimate=is_estimate,
-            builder_cfg=builder_cfg,
-        )
-    if pdf_template_key == "split_panel":
-        return _render_split_panel_pdf(
-            session=session,
-            inv=inv,
-            owner=owner,
-            customer=customer,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            customer_address=customer_address,
-            cfg=cfg,
-            template_key=template_key,
-            pdf_path=pdf_path,
-            display_no=display_no,
-            doc_label=doc_label,
-            generated_dt=generated_dt,
-            generated_str=generated_str,
-            owner_logo_abs=owner_logo_abs,
-            owner_logo_blob=owner_logo_blob,
-            is_estimate=is_estimate,
-            builder_cfg=builder_cfg,
-        )
-    if pdf_template_key == "strip":
-        return _render_strip_pdf(
-            session=session,
-            inv=inv,
-            owner=owner,
-            customer=customer,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            customer_address=customer_address,
-            cfg=cfg,
-            template_key=template_key,
-            pdf_path=pdf_path,
-            display_no=display_no,
-            doc_label=doc_label,
-            generated_dt=generated_dt,
-            generated_str=generated_str,
-            owner_logo_abs=owner_logo_abs,
-            owner_logo_blob=owner_logo_blob,
-            is_estimate=is_estimate,
-            builder_cfg=builder_cfg,
-        )
-    if pdf_template_key == "basic":
-        return _render_basic_pdf(
-            session=session,
-            inv=inv,
-            owner=owner,
-            customer=customer,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            customer_address=customer_address,
-            cfg=cfg,
-            pdf_path=pdf_path,
-            display_no=display_no,
-            doc_label=doc_label,
-            generated_dt=generated_dt,
-            generated_str=generated_str,
-            is_estimate=is_estimate,
-        )
-    if pdf_template_key == "simple":
-        return _render_simple_pdf(
-            session=session,
-            inv=inv,
-            owner=owner,
-            customer=customer,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            customer_address=customer_address,
-            cfg=cfg,
-            pdf_path=pdf_path,
-            display_no=display_no,
-            doc_label=doc_label,
-            generated_dt=generated_dt,
-            generated_str=generated_str,
-            owner_logo_abs=owner_logo_abs,
-            owner_logo_blob=owner_logo_blob,
-            is_estimate=is_estimate,
-        )
-    if pdf_template_key == "blueprint":
-        return _render_blueprint_pdf(
-            session=session,
-            inv=inv,
-            owner=owner,
-            customer=customer,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            customer_address=customer_address,
-            cfg=cfg,
-            pdf_path=pdf_path,
-            display_no=display_no,
-            doc_label=doc_label,
-            generated_dt=generated_dt,
-            generated_str=generated_str,
-            owner_logo_abs=owner_logo_abs,
-            owner_logo_blob=owner_logo_blob,
-            is_estimate=is_estimate,
-        )
-    if pdf_template_key == "luxe":
-        return _render_luxe_pdf(
-            session=session,
-            inv=inv,
-            owner=owner,
-            customer=customer,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            customer_address=customer_address,
-            cfg=cfg,
-            pdf_path=pdf_path,
-            display_no=display_no,
-            doc_label=doc_label,
-            generated_dt=generated_dt,
-            generated_str=generated_str,
-            owner_logo_abs=owner_logo_abs,
-            owner_logo_blob=owner_logo_blob,
             is_estimate=is_estimate,
+            out_stream=out_stream,
+            commit=commit,
+            **{name: extra_args[name] for name in extra_arg_names},
         )
 
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = _StateTrackingCanvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"{doc_label.title()} - {display_no}")
     builder_enabled = bool(builder_cfg.get("enabled", False)) if isinstance(builder_cfg, dict) else False
     builder_accent = colors.HexColor(
@@ -5427,8 +5729,8 @@ def generate_and_store_pdf(
     # -----------------------------
     def right_text(x, y, text, font="Helvetica", size=10):
         pdf.setFont(font, size)
-        w = pdf.stringWidth(str(text), font, size)
-        pdf.drawString(x - w, y, str(text))
+        s = str(text)
+        pdf.drawString(x - _string_width(s, font, size), y, s)
 
     def label_value(x, y, label, value, label_font=("Helvetica-Bold", 9), value_font=("Helvetica", 10)):
         pdf.setFont(*label_font)
@@ -5468,35 +5770,7 @@ def generate_and_store_pdf(
     pdf.line(M, PAGE_H - header_h - 0.02 * inch, PAGE_W - M, PAGE_H - header_h - 0.02 * inch)
 
     # Optional logo (same placement behavior as modern)
-    logo_w = 0
-    if owner_logo_blob:
-        try:
-            img = ImageReader(io.BytesIO(owner_logo_blob))
-            iw, ih = img.getSize()
-            max_h = 0.5 * inch
-            max_w = 1.4 * inch
-            scale = min(max_w / iw, max_h / ih)
-            logo_w = iw * scale
-            logo_h = ih * scale
-            logo_x = M
-            logo_y = PAGE_H - (header_h / 2) - (logo_h / 2)
-            pdf.drawImage(img, logo_x, logo_y, width=logo_w, height=logo_h, mask="auto")
-        except Exception:
-            logo_w = 0
-    elif owner_logo_abs and os.path.exists(owner_logo_abs):
-        try:
-            img = ImageReader(owner_logo_abs)
-            iw, ih = img.getSize()
-            max_h = 0.5 * inch
-            max_w = 1.4 * inch
-            scale = min(max_w / float(iw), max_h / float(ih))
-            logo_w = float(iw) * scale
-            logo_h = float(ih) * scale
-            logo_x = M
-            logo_y = PAGE_H - (header_h / 2) - (logo_h / 2)
-            pdf.drawImage(img, logo_x, logo_y, width=logo_w, height=logo_h, mask="auto")
-        except Exception:
-            logo_w = 0
+    logo_w = _draw_logo(pdf, owner_logo, M, PAGE_H - (header_h / 2), 1.4 * inch, 0.5 * inch)
 
     # Business info (left)
     left_x = M + (logo_w + 10 if logo_w else 0)
@@ -5508,12 +5782,9 @@ def generate_and_store_pdf(
 
     pdf.setFont("Helvetica", 9)
     info_lines = []
-    for ln in header_info_lines:
+    for ln in _business_header_info_lines(owner):
         info_lines.extend(_wrap_text(ln, "Helvetica", 9, 3.6 * inch))
-    info_y = PAGE_H - 0.82 * inch
-    for ln in info_lines[:4]:
-        pdf.drawString(left_x, info_y, ln)
-        info_y -= 12
+    _draw_text_lines(pdf, left_x, PAGE_H - 0.82 * inch, info_lines[:4], 12)
 
     # Meta (right)
     meta_x = PAGE_W - M
@@ -5578,12 +5849,10 @@ def generate_and_store_pdf(
 
     # Stacked lines like strip layout, while staying inside classic box.
     pdf.setFont("Helvetica", 11)
-    y_line = name_start_y
-    for ln in bill_lines:
-        if y_line < y_bottom:
-            break
-        pdf.drawString(left_x, y_line, ln)
-        y_line -= line_step
+    bill_fit = 0
+    while bill_fit < len(bill_lines) and name_start_y - bill_fit * line_step >= y_bottom:
+        bill_fit += 1
+    _draw_text_lines(pdf, left_x, name_start_y, bill_lines[:bill_fit], line_step)
 
     
     # Job Details (wrapped job/address line)
@@ -5599,26 +5868,14 @@ def generate_and_store_pdf(
     max_job_w = box_w - 20
     job_lines = _wrap_text(job_text, "Helvetica", 10, max_job_w) if show_job else []
 
-    y_job = top_y - 32
-    line_step = 14
-
-    for ln in job_lines[:2]:  # limit so rate/hours still fit
-        pdf.drawString(x2 + 10, y_job, ln)
-        y_job -= line_step
-
+    job_detail_lines = job_lines[:2]  # limit so rate/hours still fit
     if template_key == "flipping_items":
-        pdf.drawString(x2 + 10, y_job, f"Profit: {_money(inv.labor_total())}")
-        y_job -= line_step
-        pdf.drawString(x2 + 10, y_job, f"Sold For: {_money(inv.paid)}")
+        job_detail_lines.append(f"Profit: {_money(inv.labor_total())}")
+        job_detail_lines.append(f"Sold For: {_money(inv.paid)}")
     else:
-        pdf.drawString(x2 + 10, y_job, f"{cfg['job_rate_label']}: {_money(inv.price_per_hour)}")
-        y_job -= line_step
-
-        pdf.drawString(
-            x2 + 10,
-            y_job,
-            f"{cfg['job_hours_label']}: {inv.hours} {cfg.get('hours_suffix', 'hrs')}"
-        )
+        job_detail_lines.append(f"{cfg['job_rate_label']}: {_money(inv.price_per_hour)}")
+        job_detail_lines.append(f"{cfg['job_hours_label']}: {inv.hours} {cfg.get('hours_suffix', 'hrs')}")
+    _draw_text_lines(pdf, x2 + 10, top_y - 32, job_detail_lines, 14)
 
 
     # -----------------------------
@@ -5664,19 +5921,18 @@ def generate_and_store_pdf(
             return y_local - base_row_h
 
         table_w = sum(col_widths)
+        row_rule = colors.HexColor("#DDDDDD")
         y_cursor = draw_table_header(title, y_top)
         pdf.setFont("Helvetica", 10)
 
+        # Wrap every row up front so the drawing loop below only lays out text.
+        plan = []
         for row in rows:
-            wrapped_cells = []
-            row_height = base_row_h
-
-            for i, cell in enumerate(row):
-                max_w = col_widths[i] - 12
-                lines = _wrap_text(cell, "Helvetica", 10, max_w)
-                wrapped_cells.append(lines)
-                row_height = max(row_height, len(lines) * base_row_h)
+            wrapped_cells = [_wrap_text(cell, "Helvetica", 10, col_widths[i] - 12) for i, cell in enumerate(row)]
+            row_height = max([base_row_h] + [len(lines) * base_row_h for lines in wrapped_cells])
+            plan.append((wrapped_cells, row_height))
 
+        for wrapped_cells, row_height in plan:
             if (y_cursor - row_height) < min_content_y:
                 next_top = _start_cont_page()
                 y_cursor = draw_table_header(f"{title} (cont.)", next_top)
@@ -5685,16 +5941,17 @@ def generate_and_store_pdf(
 
             cx = x
             for i, lines in enumerate(wrapped_cells):
-                line_y = y_cursor
-                for line in lines:
-                    if i in money_cols:
+                if i in money_cols:
+                    line_y = y_cursor
+                    for line in lines:
                         right_text(cx + col_widths[i] - 6, line_y, line, "Helvetica", 10)
-                    else:
-                        pdf.drawString(cx + 6, line_y, line)
-                    line_y -= base_row_h
+                        line_y -= base_row_h
+                else:
+                    _draw_text_lines(pdf, cx + 6, y_cursor, lines, base_row_h)
                 cx += col_widths[i]
 
-            pdf.setStrokeColor(colors.HexColor("#DDDDDD"))
+            # Only the first row after a header emits RG; the tracking canvas drops the rest.
+            pdf.setStrokeColor(row_rule)
             pdf.line(x, y_cursor - 4, x + table_w, y_cursor - 4)
             y_cursor -= row_height
 
@@ -5706,24 +5963,26 @@ def generate_and_store_pdf(
     # -----------------------------
     # Labor table
     # -----------------------------
+    # Rows are only formatted for tables that will be drawn (has_*_rows is always
+    # checked together with show_*).
     labor_rows = []
-    rate = float(inv.price_per_hour or 0.0)
-    for li in labor_items:
-        try:
-            t = float(li.labor_time_hours or 0.0)
-        except Exception:
-            t = 0.0
-        line_total = t * rate
-        labor_rows.append([
-            li.labor_desc or "",
-            f"{t:g} {cfg.get('hours_suffix', 'hrs')}" if t else "",
-            _money(line_total) if line_total else ""
-        ])
+    has_labor_rows = False
+    if show_labor:
+        rate = float(inv.price_per_hour or 0.0)
+        hours_suffix = cfg.get("hours_suffix", "hrs")
+        for li in labor_items:
+            t = _to_float(li.labor_time_hours)
+            line_total = t * rate
+            labor_desc = li.labor_desc or ""
+            time_txt = f"{t:g} {hours_suffix}" if t else ""
+            total_txt = _money(line_total) if line_total else ""
+            if labor_desc or time_txt or total_txt:
+                has_labor_rows = True
+            labor_rows.append([labor_desc, time_txt, total_txt])
 
-    has_labor_rows = any((row[0] or row[1] or row[2]) for row in labor_rows)
     if show_labor and has_labor_rows:
         body_y = draw_table(
-            cfg["labor_title"],
+            labor_title,
             M,
             body_y,
             [cfg["labor_desc_label"], cfg.get("labor_time_label", "Time"), cfg.get("labor_total_label", "Line Total")],
@@ -5736,16 +5995,18 @@ def generate_and_store_pdf(
     # Parts / Materials table
     # -----------------------------
     parts_rows = []
-    for p in parts:
-        parts_rows.append([
-            p.part_name or "",
-            _money(inv.part_price_with_markup(p.part_price or 0.0)) if (p.part_price or 0.0) else ""
-        ])
+    has_parts_rows = False
+    if show_parts:
+        for p, price in zip(parts, _part_prices_with_markup(inv, parts)):
+            part_name = p.part_name or ""
+            price_txt = _money(price) if (p.part_price or 0.0) else ""
+            if part_name or price_txt:
+                has_parts_rows = True
+            parts_rows.append([part_name, price_txt])
 
-    has_parts_rows = any((row[0] or row[1]) for row in parts_rows)
     if show_parts and has_parts_rows:
         body_y = draw_table(
-            cfg["parts_title"],
+            parts_title,
             M,
             body_y - 10,
             [cfg["parts_name_label"], cfg.get("parts_price_label", "Price")],
@@ -5779,15 +6040,14 @@ def generate_and_store_pdf(
     payment_methods_h = _payment_methods_footer_height(owner, PAGE_W - (2 * M)) if not is_estimate else 0.0
     page_bottom_limit = footer_y + footer_clearance + payment_methods_h
 
-    needed_text_h = 0
-    for ln in all_note_lines:
-        needed_text_h += SPACER_GAP if ln == "__SPACER__" else line_height
+    spacer_count = all_note_lines.count("__SPACER__")
+    needed_text_h = spacer_count * SPACER_GAP + (len(all_note_lines) - spacer_count) * line_height
     needed_box_h = header_title_gap + needed_text_h + bottom_padding
 
     max_box_h_this_page = notes_y_top - page_bottom_limit
     notes_box_h = min(max_box_h_this_page, needed_box_h) if show_notes else 0
 
-    remaining_lines = []
+    notes_idx = 0
     if show_notes:
         pdf.roundRect(M, notes_y_top - notes_box_h, notes_box_w, notes_box_h, 8, stroke=1, fill=0)
         pdf.setFont("Helvetica-Bold", 11)
@@ -5808,7 +6068,7 @@ def generate_and_store_pdf(
                 y_note -= line_height
             lines_fit += 1
 
-        remaining_lines = all_note_lines[lines_fit:]
+        notes_idx = lines_fit
 
     # Summary box
     sum_x = PAGE_W - M - 240
@@ -5849,9 +6109,9 @@ def generate_and_store_pdf(
     y = notes_y_top - 42
 
     if show_parts and has_parts_rows and total_parts:
-        label_right_value(sum_x + 10, right_edge, y, f"{cfg['parts_title']}:", _money(total_parts)); y -= 16
+        label_right_value(sum_x + 10, right_edge, y, f"{parts_title}:", _money(total_parts)); y -= 16
     if show_labor and has_labor_rows and total_labor:
-        label_right_value(sum_x + 10, right_edge, y, f"{cfg['labor_title']}:", _money(total_labor)); y -= 16
+        label_right_value(sum_x + 10, right_edge, y, f"{labor_title}:", _money(total_labor)); y -= 16
     if show_shop_supplies and inv.shop_supplies:
         label_right_value(sum_x + 10, right_edge, y, f"{cfg['shop_supplies_label']}:", _money(inv.shop_supplies)); y -= 16
     if tax_amount:
@@ -5902,9 +6162,9 @@ def generate_and_store_pdf(
             pdf.drawRightString(PAGE_W - M, footer_y, "Thank you for your business.")
         pdf.setFillColorRGB(0, 0, 0)
 
-    if show_notes and remaining_lines:
+    if show_notes and notes_idx < len(all_note_lines):
         footer()
-        while remaining_lines:
+        while notes_idx < len(all_note_lines):
             start_new_page_with_header()
 
             notes_y_top_2 = PAGE_H - (M + 0.6 * inch)
@@ -5920,7 +6180,7 @@ def generate_and_store_pdf(
             bottom2 = notes_y_top_2 - notes_box_h_2 + bottom_padding
 
             fit2 = 0
-            for line in remaining_lines:
+            for line in islice(all_note_lines, notes_idx, None):
                 if y_note2 < bottom2:
                     break
                 if line == "__SPACER__":
@@ -5930,22 +6190,37 @@ def generate_and_store_pdf(
                     y_note2 -= line_height
                 fit2 += 1
 
-            remaining_lines = remaining_lines[fit2:]
+            notes_idx += fit2
             footer()
     else:
         footer()
 
-    pdf.save()
+    _save_pdf(pdf, pdf_path, out_stream)
 
     # Update DB record
     inv.pdf_path = pdf_path
     inv.pdf_generated_at = generated_dt
-    session.add(inv)
-    session.commit()
+    if commit:
+        session.commit()
 
     return pdf_path
 
 
+def generate_and_store_pdfs(session, invoice_ids, **kwargs) -> list[str]:
+    """
+    Generates PDFs for several invoices, committing the updated pdf_path /
+    pdf_generated_at values once at the end instead of once per invoice.
+    Extra keyword arguments are passed through to generate_and_store_pdf.
+    Each invoice still renders on its own canvas: invoice.pdf_path points at a
+    standalone file that is downloaded, emailed and zipped individually.
+
+    Returns: absolute pdf paths in the same order as invoice_ids.
+    """
+    paths = [generate_and_store_pdf(session, invoice_id, commit=False, **kwargs) for invoice_id in invoice_ids]
+    session.commit()
+    return paths
+
+
 def generate_profit_loss_pdf(
     *,
     owner: User | None,
@@ -5971,13 +6246,13 @@ def generate_profit_loss_pdf(
 
     PAGE_W, PAGE_H = LETTER
     M = 0.75 * inch
-    pdf = canvas.Canvas(pdf_path, pagesize=LETTER)
+    pdf = canvas.Canvas(pdf_path, pagesize=LETTER, pageCompression=1)
     pdf.setTitle(f"Profit and Loss - {period_label}")
 
     def right_text(x, y, text, font="Helvetica", size=10):
         pdf.setFont(font, size)
-        w = pdf.stringWidth(str(text), font, size)
-        pdf.drawString(x - w, y, str(text))
+        s = str(text)
+        pdf.drawString(x - _string_width(s, font, size), y, s)
 
     y = PAGE_H - M
     pdf.setFont("Helvetica-Bold", 17)
@@ -6064,10 +6339,12 @@ def generate_profit_loss_pdf(
     pdf.save()
     return pdf_path
 def _invoice_builder_cfg(owner: User | None, override: dict | None = None) -> dict:
-    raw_enabled = bool(getattr(owner, "invoice_builder_enabled", False)) if owner else False
-    raw_accent = (getattr(owner, "invoice_builder_accent_color", None) or "#0f172a") if owner else "#0f172a"
-    raw_header = (getattr(owner, "invoice_builder_header_style", None) or "classic") if owner else "classic"
-    raw_compact = bool(getattr(owner, "invoice_builder_compact_mode", False)) if owner else False
+    raw_enabled, raw_accent, raw_header, raw_compact = False, "#0f172a", "classic", False
+    if owner:
+        raw_enabled = bool(owner.invoice_builder_enabled)
+        raw_accent = owner.invoice_builder_accent_color or raw_accent
+        raw_header = owner.invoice_builder_header_style or raw_header
+        raw_compact = bool(owner.invoice_builder_compact_mode)
     if override:
         raw_enabled = bool(override.get("enabled", raw_enabled))
         raw_accent = str(override.get("accent_color", raw_accent) or raw_accent)
@@ -6075,7 +6352,7 @@ def _invoice_builder_cfg(owner: User | None, override: dict | None = None) -> di
         raw_compact = bool(override.get("compact_mode", raw_compact))
 
     accent = raw_accent.strip()
-    if not re.fullmatch(r"#[0-9a-fA-F]{6}", accent):
+    if not _HEX_COLOR_RE.fullmatch(accent):
         accent = "#0f172a"
     header_style = raw_header.strip().lower()
     if header_style not in ("classic", "banded"):
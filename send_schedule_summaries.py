@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 from sqlalchemy import or_
@@ -19,6 +21,16 @@ from config import Config
 from models import Customer, ScheduleEvent, User, make_engine, make_session_factory
 
 
+# Summary emails are sent concurrently; each send is mostly SMTP round trips.
+SUMMARY_SEND_WORKERS = 8
+
+
+def _deliver_summary(app, to_email: str, subject: str, body: str) -> None:
+    # The SMTP helper reads its settings from current_app, which is bound per thread.
+    with app.app_context():
+        _send_schedule_summary_email(to_email, subject, body)
+
+
 def main() -> None:
     app = create_app()
     engine = make_engine(Config.SQLALCHEMY_DATABASE_URI, echo=Config.SQLALCHEMY_ECHO)
@@ -45,18 +57,56 @@ def main() -> None:
                     s.rollback()
             print("[PAYMENT REMINDER] cron run complete", flush=True)
 
+            # Only the summary settings are needed here; plain rows skip loading whole
+            # accounts (logo blobs included) and are not expired by the per-user commits.
             users = (
-                s.query(User)
+                s.query(
+                    User.id,
+                    User.email,
+                    User.schedule_summary_frequency,
+                    User.schedule_summary_time,
+                    User.schedule_summary_tz_offset_minutes,
+                    User.schedule_summary_last_sent,
+                )
                 .filter(User.schedule_summary_frequency.isnot(None))
                 .all()
             )
+            windows = {user.id: _summary_window_for_user(user, now) for user in users if _should_send_summary(user, now)}
+
+            # Load the events of every due user in one query over the union of their
+            # windows; each user's list is narrowed to their own window below. Only the
+            # columns _format_event_line reads are selected, with the customer's name
+            # joined in, so each row can stand in for both the event and its customer.
+            events_by_user = defaultdict(list)
+            if windows:
+                for event in (
+                    s.query(
+                        ScheduleEvent.user_id,
+                        ScheduleEvent.customer_id,
+                        ScheduleEvent.title,
+                        ScheduleEvent.start_dt,
+                        ScheduleEvent.end_dt,
+                        Customer.name,
+                    )
+                    .outerjoin(Customer, Customer.id == ScheduleEvent.customer_id)
+                    .filter(ScheduleEvent.user_id.in_(list(windows)))
+                    .filter(ScheduleEvent.status == "scheduled")
+                    .filter(or_(ScheduleEvent.event_type.is_(None), ScheduleEvent.event_type != "block"))
+                    .filter(ScheduleEvent.start_dt < max(w[1] for w in windows.values()))
+                    .filter(ScheduleEvent.end_dt > min(w[0] for w in windows.values()))
+                    .order_by(ScheduleEvent.start_dt.asc())
+                ):
+                    events_by_user[event.user_id].append(
+                        (event.start_dt, event.end_dt, _format_event_line(event, event if event.customer_id is not None else None))
+                    )
 
+            deliveries = []
             for user in users:
                 freq = (user.schedule_summary_frequency or "none").lower().strip()
                 if freq == "none":
                     print(f"[SCHEDULE SUMMARY] user={user.id} skipped (frequency=none)", flush=True)
                     continue
-                if not _should_send_summary(user, now):
+                if user.id not in windows:
                     print(f"[SCHEDULE SUMMARY] user={user.id} skipped (not time yet)", flush=True)
                     continue
 
@@ -65,27 +115,17 @@ def main() -> None:
                     print(f"[SCHEDULE SUMMARY] user={user.id} skipped (invalid email)", flush=True)
                     continue
 
-                start, end, tz_label, _now_local = _summary_window_for_user(user, now)
-                events = (
-                    s.query(ScheduleEvent)
-                    .filter(ScheduleEvent.user_id == user.id)
-                    .filter(ScheduleEvent.status == "scheduled")
-                    .filter(or_(ScheduleEvent.event_type.is_(None), ScheduleEvent.event_type != "block"))
-                    .filter(ScheduleEvent.start_dt < end)
-                    .filter(ScheduleEvent.end_dt > start)
-                    .order_by(ScheduleEvent.start_dt.asc())
-                    .all()
-                )
+                start, end, tz_label, _now_local = windows[user.id]
+                lines = [
+                    line
+                    for event_start, event_end, line in events_by_user.get(user.id, ())
+                    if event_start < end and event_end > start
+                ]
 
-                if not events:
+                if not lines:
                     print(f"[SCHEDULE SUMMARY] user={user.id} skipped (no events)", flush=True)
                     continue
 
-                lines = []
-                for event in events:
-                    customer = s.get(Customer, event.customer_id) if event.customer_id else None
-                    lines.append(_format_event_line(event, customer))
-
                 end_display = end - timedelta(seconds=1)
                 subject = f"Upcoming appointments ({freq})"
                 body = (
@@ -94,19 +134,35 @@ def main() -> None:
                     + "\n".join(lines)
                 )
 
-                try:
-                    print(
-                        f"[SCHEDULE SUMMARY] user={user.id} sending {len(events)} event(s) to {to_email}",
-                        flush=True,
+                print(
+                    f"[SCHEDULE SUMMARY] user={user.id} sending {len(lines)} event(s) to {to_email}",
+                    flush=True,
+                )
+                deliveries.append((user.id, to_email, subject, body))
+
+            if not deliveries:
+                return
+
+            # Only the sends run on worker threads; the session stays on this thread and
+            # each user's last-sent time is still committed as soon as their email is out.
+            with ThreadPoolExecutor(max_workers=min(SUMMARY_SEND_WORKERS, len(deliveries))) as pool:
+                futures = {
+                    pool.submit(_deliver_summary, app, to_email, subject, body): user_id
+                    for user_id, to_email, subject, body in deliveries
+                }
+                for fut in as_completed(futures):
+                    user_id = futures[fut]
+                    try:
+                        fut.result()
+                        print(f"[SCHEDULE SUMMARY] user={user_id} email sent", flush=True)
+                    except Exception as exc:
+                        print(f"[SCHEDULE SUMMARY] Email failed for user={user_id}: {exc!r}", flush=True)
+                        continue
+
+                    s.query(User).filter(User.id == user_id).update(
+                        {"schedule_summary_last_sent": now}, synchronize_session=False
                     )
-                    _send_schedule_summary_email(to_email, subject, body)
-                    print(f"[SCHEDULE SUMMARY] user={user.id} email sent", flush=True)
-                except Exception as exc:
-                    print(f"[SCHEDULE SUMMARY] Email failed for user={user.id}: {exc!r}", flush=True)
-                    continue
-
-                user.schedule_summary_last_sent = now
-                s.commit()
+                    s.commit()
 
 
 if __name__ == "__main__":